@@ -144,7 +144,7 @@ class Game:
             player_hands.append(PlayerView(
                 name=p.name, character=p.character,
                 is_current_player=False,
-                cards=cards, game_score=p.players_game_score,
+                cards=tuple(cards), game_score=p.players_game_score,
                 called_kabo=p.called_kabo,
             ))
 
@@ -159,7 +159,7 @@ class Game:
 
         summary = RoundSummary(
             round_number=_round.round_id,
-            player_hands=player_hands,
+            player_hands=tuple(player_hands),
             round_scores=_round.round_scores,
             game_scores={p.name: p.players_game_score for p in _round.players},
             kabo_caller=kabo_caller,
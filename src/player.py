@@ -303,6 +303,14 @@ class Player:
         else:
             self.failed_multi_exchange(drawn_card, _cards_to_be_discarded, _round)
 
+    def log_exchange(self, message: str) -> None:
+        """
+        Print a card exchange message, which may reveal card values; child classes can override it to mask them
+        :param message: str, description of the exchange
+        :return: None
+        """
+        print(message)
+
     def perform_card_exchange(
         self, cards_selected_for_exchange: List[Card], drawn_card: Card, _round: Round
     ) -> None:
@@ -340,8 +348,8 @@ class Player:
             _round.discard_card(drawn_card)
 
         exchanged_values = [c.value for c in cards_selected_for_exchange]
-        print(f"  {self.name} exchanged {len(cards_selected_for_exchange)} card(s) "
-              f"(values: {exchanged_values}) for card {drawn_card.value}.")
+        self.log_exchange(f"  {self.name} exchanged {len(cards_selected_for_exchange)} card(s) "
+                          f"(values: {exchanged_values}) for card {drawn_card.value}.")
 
     def failed_multi_exchange(self, drawn_card: Card, attempted_cards: List[Card], _round: Round) -> None:
         """
@@ -354,8 +362,8 @@ class Player:
         :return:
         """
         attempted_values = [c.value for c in attempted_cards]
-        print(f"  Exchange FAILED! {self.name} attempted {len(attempted_cards)} cards "
-              f"(values: {attempted_values}) but they don't match.")
+        self.log_exchange(f"  Exchange FAILED! {self.name} attempted {len(attempted_cards)} cards "
+                          f"(values: {attempted_values}) but they don't match.")
 
         # Compute positions of attempted cards before modifying the hand
         attempted_positions = [self.hand.index(c) for c in attempted_cards]
@@ -367,7 +375,7 @@ class Player:
         # Insert drawn card at the position closest to the attempted cards
         insert_pos = min(attempted_positions)
         self.hand.insert(insert_pos, drawn_card)
-        print(f"  Drawn card ({drawn_card.value}) added to {self.name}'s hand at position {insert_pos}.")
+        self.log_exchange(f"  Drawn card ({drawn_card.value}) added to {self.name}'s hand at position {insert_pos}.")
 
         # If 3+ cards were attempted and failed, draw a penalty card from the deck
         if len(attempted_cards) >= 3 and _round.main_deck.cards:
@@ -377,7 +385,7 @@ class Player:
             penalty_pos = max(attempted_positions) + 2  # +2 because drawn_card was inserted before
             penalty_pos = min(penalty_pos, len(self.hand))
             self.hand.insert(penalty_pos, penalty_card)
-            print(f"  Penalty card drawn and added to {self.name}'s hand at position {penalty_pos}.")
+            self.log_exchange(f"  Penalty card drawn and added to {self.name}'s hand at position {penalty_pos}.")
 
     def peak(self) -> None:
         """
@@ -12,7 +12,8 @@ the queue and applies UI updates.
 import os
 import queue
 from nicegui import ui, app
-from typing import Optional
+from starlette.requests import Request
+from typing import Callable, Optional
 
 from src.web.event_bus import EventBus
 from src.web.game_session import GameSession
@@ -23,11 +24,23 @@ from src.web.game_room import (
 )
 from src.web.components.setup_page import render_setup_page
 from src.web.components.lobby_page import render_lobby_page
-from src.web.components.room_waiting_page import render_room_waiting_page
+from src.web.components.room_waiting_page import (
+    render_room_waiting_page, forget_room,
+)
 from src.web.components.join_page import render_join_page
 from src.web.components.game_table import GameTable
 
 
+# Snapshot events that may be dropped when the next queued event replaces
+# them. A plain state_update carries nothing beyond the snapshot; a
+# turn_update also sets the action panel, so only another turn_update
+# supersedes it.
+_SUPERSEDED_BY = {
+    "state_update": frozenset({"state_update", "turn_update"}),
+    "turn_update": frozenset({"turn_update"}),
+}
+
+
 class WebApp:
     """Per-session web application state."""
 
@@ -43,6 +56,10 @@ class WebApp:
         self.room: Optional[GameRoom] = None
         self.player_name: Optional[str] = None
         self.is_host: bool = False
+        # Scheme + host the page was served from, for shareable join links
+        self.origin: str = ""
+        # Waiting-room handler for "room_update" events (set while in the lobby)
+        self._on_room_update: Optional[Callable[[dict], None]] = None
 
     def start_game(self, player_name: str, ai_count: int) -> None:
         """Initialize and start a new solo game session."""
@@ -80,32 +97,63 @@ class WebApp:
         """Subscribe to events on the given EventBus."""
         bus.subscribe("state_update", lambda s: self._ui_queue.put(("state_update", s)))
         bus.subscribe("input_request", lambda r: self._ui_queue.put(("input_request", r)))
+        bus.subscribe("turn_update", lambda s: self._ui_queue.put(("turn_update", s)))
         bus.subscribe("log", lambda m: self._ui_queue.put(("log", m)))
+        bus.subscribe("log_batch", lambda ms: self._ui_queue.put(("log_batch", ms)))
         bus.subscribe("game_over", lambda d: self._ui_queue.put(("game_over", d)))
         bus.subscribe("card_revealed", lambda d: self._ui_queue.put(("card_revealed", d)))
         bus.subscribe("notification", lambda n: self._ui_queue.put(("notification", n)))
         bus.subscribe("animation", lambda a: self._ui_queue.put(("animation", a)))
 
+    def _enqueue_room_update(self, info: dict) -> None:
+        """GameRoom.room_bus callback: hand the lobby info to the UI thread."""
+        self._ui_queue.put(("room_update", info))
+
+    def subscribe_to_room(self) -> None:
+        """Listen for lobby changes on the current room."""
+        if self.room:
+            self.room.room_bus.subscribe("room_update", self._enqueue_room_update)
+
+    def unsubscribe_from_room(self) -> None:
+        """Stop listening for lobby changes on the current room."""
+        self._on_room_update = None
+        if self.room:
+            self.room.room_bus.unsubscribe("room_update", self._enqueue_room_update)
+
     def submit_response(self, response) -> None:
         """Forward UI response to the WebPlayer."""
         if self.web_player:
             self.web_player.submit_response(response)
 
     def process_ui_events(self) -> None:
-        """Drain the event queue and apply UI updates. Called by ui.timer on UI thread."""
-        while not self._ui_queue.empty():
+        """Drain the event queue and apply UI updates. Called by ui.timer on UI thread.
+
+        A full snapshot that is immediately followed by another one in the
+        same drain is skipped, so a burst of updates renders once.
+        """
+        events = []
+        while True:
             try:
-                event_type, data = self._ui_queue.get_nowait()
+                events.append(self._ui_queue.get_nowait())
             except queue.Empty:
                 break
 
+        last = len(events) - 1
+        for i, (event_type, data) in enumerate(events):
+            if i < last and event_type in _SUPERSEDED_BY:
+                if events[i + 1][0] in _SUPERSEDED_BY[event_type]:
+                    continue
             try:
                 if event_type == "state_update":
                     self._on_state_update(data)
                 elif event_type == "input_request":
                     self._on_input_request(data)
+                elif event_type == "turn_update":
+                    self._on_turn_update(data)
                 elif event_type == "log":
                     self._on_log(data)
+                elif event_type == "log_batch":
+                    self._on_log_batch(data)
                 elif event_type == "game_over":
                     self._on_game_over(data)
                 elif event_type == "card_revealed":
@@ -114,6 +162,9 @@ class WebApp:
                     self._on_notification(data)
                 elif event_type == "animation":
                     self._on_animation(data)
+                elif event_type == "room_update":
+                    if self._on_room_update:
+                        self._on_room_update(data)
             except Exception as e:
                 print(f"[WebApp] Error processing {event_type}: {e}")
 
@@ -122,6 +173,11 @@ class WebApp:
         if self.game_table:
             self.game_table.update_state(state)
 
+    def _on_turn_update(self, state: GameStateSnapshot) -> None:
+        """State snapshot and its input request delivered as one event."""
+        self._on_state_update(state)
+        self._on_input_request(state.input_request)
+
     def _on_input_request(self, request) -> None:
         if self.game_table and request:
             self.game_table.action_panel.show_request(request)
@@ -130,6 +186,10 @@ class WebApp:
         if self.game_table:
             self.game_table.game_log.add_message(str(message))
 
+    def _on_log_batch(self, messages) -> None:
+        if self.game_table:
+            self.game_table.game_log.add_messages([str(m) for m in messages])
+
     def _on_game_over(self, _data) -> None:
         if self.game_table and self._last_state:
             self.game_table.show_game_over(self._last_state)
@@ -147,12 +207,25 @@ class WebApp:
             self.game_table.enqueue_animation(event)
 
 
+def _request_origin(request: Request) -> str:
+    """Return the public origin (scheme://host) of a page request.
+
+    Honours X-Forwarded-Proto / X-Forwarded-Host so links stay correct
+    behind a reverse proxy.
+    """
+    headers = request.headers
+    scheme = headers.get("x-forwarded-proto", request.url.scheme).split(",")[0].strip()
+    host = headers.get("x-forwarded-host") or headers.get("host") or request.url.netloc
+    return f"{scheme}://{host.split(',')[0].strip()}"
+
+
 def start_web_gui(port: int = 8080) -> None:
     """Launch the NiceGUI web application."""
 
     @ui.page("/")
-    def index():
+    def index(request: Request):
         _webapp = WebApp()
+        _webapp.origin = _request_origin(request)
 
         ui.dark_mode().enable()
         ui.query("body").style("background-color: #1a1a2e;")
@@ -305,8 +378,9 @@ def start_web_gui(port: int = 8080) -> None:
             )
 
     @ui.page("/join/{room_code}")
-    def join_page(room_code: str):
+    def join_page(room_code: str, request: Request):
         _webapp = WebApp()
+        _webapp.origin = _request_origin(request)
 
         ui.dark_mode().enable()
         ui.query("body").style("background-color: #1a1a2e;")
@@ -423,35 +497,48 @@ def start_web_gui(port: int = 8080) -> None:
         def get_room_info():
             if not _webapp.room:
                 return None
-            return {
-                "players": _webapp.room.get_player_names(),
-                "max_players": _webapp.room.max_players,
-                "ai_count": _webapp.room.ai_count,
-                "state": _webapp.room.state,
-                "host_name": _webapp.room.host_name,
-                "show_revelations": _webapp.room.show_revelations,
-            }
+            return _webapp.room.get_room_info()
 
         def on_start():
             try:
                 _webapp.start_multiplayer_game()
                 _webapp.connect_to_room_game()
+                _webapp.unsubscribe_from_room()
                 _transition_to_game(
                     _webapp, waiting_container, game_container
                 )
+                return True
             except ValueError as e:
                 ui.notify(str(e), type="negative")
+                return False
 
         def on_leave():
+            _webapp.unsubscribe_from_room()
             if _webapp.room and _webapp.player_name:
                 _webapp.room.remove_player(_webapp.player_name)
                 if _webapp.is_host:
                     remove_room(_webapp.room.room_code)
+                    forget_room(_webapp.room.room_code)
             app.storage.user.pop("room_code", None)
             app.storage.user.pop("player_name", None)
             ui.navigate.to("/")
 
-        join_url = f"/join/{_webapp.room.room_code}" if _webapp.room else ""
+        def subscribe_updates(refresh: Callable[[dict], None]):
+            def on_room_update(info: dict):
+                refresh(info)
+                # Non-host players follow the host into the game
+                if not _webapp.is_host and info["state"] == "playing":
+                    _webapp.unsubscribe_from_room()
+                    _webapp.connect_to_room_game()
+                    _transition_to_game(
+                        _webapp, waiting_container, game_container
+                    )
+
+            _webapp._on_room_update = on_room_update
+            return on_room_update
+
+        join_url = (f"{_webapp.origin}/join/{_webapp.room.room_code}"
+                    if _webapp.room else "")
 
         with waiting_container:
             render_room_waiting_page(
@@ -462,19 +549,15 @@ def start_web_gui(port: int = 8080) -> None:
                 on_start=on_start,
                 on_leave=on_leave,
                 join_url=join_url,
+                subscribe_updates=subscribe_updates,
             )
-
-        # For non-host players: poll room state to detect game start
-        if not _webapp.is_host:
-            def check_game_started():
-                if _webapp.room and _webapp.room.state == "playing":
-                    _webapp.connect_to_room_game()
-                    _transition_to_game(
-                        _webapp, waiting_container, game_container
-                    )
-                    timer.deactivate()
-
-            timer = ui.timer(1.0, check_game_started)
+        _webapp.subscribe_to_room()
+        # A tab closed in the lobby never reaches on_leave; drop its handler
+        # with the client so the room doesn't keep it alive (on_delete is
+        # NiceGUI 2.x; older versions only have on_disconnect)
+        client = ui.context.client
+        getattr(client, "on_delete", client.on_disconnect)(
+            _webapp.unsubscribe_from_room)
 
     def _transition_to_game(_webapp: WebApp, from_container,
                             game_container):
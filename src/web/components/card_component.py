@@ -31,20 +31,31 @@ EFFECT_NAMES = {
 }
 
 
+# Border/shadow classes toggled by card selection
+_SELECTED_CLASSES = "border-2 border-yellow-400 shadow-lg"
+_UNSELECTED_CLASSES = "border border-gray-600 shadow-md"
+# Cursor/hover classes toggled by card clickability
+_CLICKABLE_CLASSES = "cursor-pointer hover:scale-110 transition-transform card-hover"
+
+
 def render_card(card: CardView, size: str = "normal",
                 clickable: bool = False, on_click=None,
                 selected: bool = False, label: str = "",
-                animate: str = "") -> None:
+                animate: str = "") -> ui.element:
     """Render a single card as an HTML element.
 
     Args:
         card: CardView with value (or None for face-down)
         size: "small" for opponent cards, "normal" for player's own
-        clickable: whether the card should be clickable
-        on_click: callback when clicked
+        clickable: whether the card should be styled as clickable
+        on_click: callback when clicked (attached even if not clickable, so
+            the click styling can later be toggled with set_card_clickable)
         selected: whether to show selected highlight
         label: optional label below the card (e.g. position number)
         animate: CSS animation class (e.g. "animate-draw", "animate-appear")
+
+    Returns:
+        The card element, so callers can toggle its selection in place.
     """
     if size == "small":
         w, h, text_size = "w-12", "h-16", "text-sm"
@@ -62,13 +73,12 @@ def render_card(card: CardView, size: str = "normal",
         display_text = "?"
         effect = ""
 
-    border = "border-2 border-yellow-400" if selected else "border border-gray-600"
-    cursor = "cursor-pointer hover:scale-110 transition-transform card-hover" if clickable else ""
-    shadow = "shadow-lg" if selected else "shadow-md"
+    selection = _SELECTED_CLASSES if selected else _UNSELECTED_CLASSES
+    cursor = _CLICKABLE_CLASSES if clickable else ""
 
     with ui.column().classes(f"items-center gap-0.5"):
         card_el = ui.element("div").classes(
-            f"{w} {h} rounded-lg {border} {cursor} {shadow} {animate} "
+            f"{w} {h} rounded-lg {selection} {cursor} {animate} "
             f"flex flex-col items-center justify-center select-none"
         ).style(f"background-color: {bg_color}; color: white;")
 
@@ -77,12 +87,30 @@ def render_card(card: CardView, size: str = "normal",
             if effect:
                 ui.label(effect).classes("text-xs opacity-80")
 
-        if clickable and on_click:
+        if on_click:
             card_el.on("click", lambda e, cb=on_click: cb())
 
         if label:
             ui.label(label).classes("text-xs text-gray-400")
 
+    return card_el
+
+
+def set_card_selected(card_el: ui.element, selected: bool) -> None:
+    """Toggle the selection highlight of a card rendered by render_card."""
+    if selected:
+        card_el.classes(add=_SELECTED_CLASSES, remove=_UNSELECTED_CLASSES)
+    else:
+        card_el.classes(add=_UNSELECTED_CLASSES, remove=_SELECTED_CLASSES)
+
+
+def set_card_clickable(card_el: ui.element, clickable: bool) -> None:
+    """Toggle the click styling of a card rendered by render_card."""
+    if clickable:
+        card_el.classes(add=_CLICKABLE_CLASSES)
+    else:
+        card_el.classes(remove=_CLICKABLE_CLASSES)
+
 
 def render_card_back(size: str = "normal", label: str = "",
                      clickable: bool = False, on_click=None) -> None:
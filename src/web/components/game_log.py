@@ -23,18 +23,24 @@ class GameLog:
 
     def add_message(self, message: str) -> None:
         """Add a message to the log and auto-scroll."""
-        if not message or not message.strip():
+        self.add_messages([message])
+
+    def add_messages(self, messages: List[str]) -> None:
+        """Add several messages to the log with a single auto-scroll."""
+        lines = [m.strip() for m in messages if m and m.strip()]
+        if not lines:
             return
-        self._messages.append(message.strip())
+        self._messages.extend(lines)
         # Keep last 200 messages
         if len(self._messages) > 200:
             self._messages = self._messages[-200:]
 
         if self._log_container:
             with self._log_container:
-                ui.label(message.strip()).classes(
-                    "text-xs text-gray-300 font-mono whitespace-pre-wrap"
-                )
+                for line in lines:
+                    ui.label(line).classes(
+                        "text-xs text-gray-300 font-mono whitespace-pre-wrap"
+                    )
             if self._scroll_area:
                 self._scroll_area.scroll_to(percent=1.0)
 
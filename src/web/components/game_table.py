@@ -8,19 +8,48 @@ Layout:
   - Below: Action panel
   - Footer: Game log + Scoreboard
 """
+import html
+import time
+
 from nicegui import ui, app
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
+from config.rules import CARD_AMOUNTS
 from src.web.game_state import (
     GameStateSnapshot, PlayerView, CardView, RoundSummary, TurnNotification,
     AnimationEvent,
 )
-from src.web.components.card_component import render_card, render_card_back, render_deck, render_discard_pile
+from src.web.components.card_component import (
+    render_card, render_card_back, render_deck, render_discard_pile,
+    set_card_clickable, set_card_selected,
+)
 from src.web.components.game_log import GameLog
 from src.web.components.scoreboard import Scoreboard
 from src.web.components.action_panel import ActionPanel
 
 
+# Input request type -> table click mode (request types not listed are not clickable)
+_REQUEST_TYPE_TO_CLICKABLE = {
+    "pick_turn_type": "pick_turn_type",
+    "decide_on_card_use": "decide_on_card_use",
+    "pick_hand_cards_for_exchange": "pick_hand_cards_for_exchange",
+    "pick_cards_to_see": "pick_cards_to_see",
+    "specify_spying": "specify_spying",
+    "specify_swap": "specify_swap_own",
+}
+# Click modes in which the player's own hand / opponents' cards accept clicks
+_HAND_CLICKABLE_MODES = frozenset({
+    "decide_on_card_use",
+    "pick_hand_cards_for_exchange", "pick_cards_to_see",
+    "specify_swap_own",
+})
+_OPP_CLICKABLE_MODES = frozenset({"specify_spying", "specify_swap_opponent"})
+# "#<position>" card labels; a hand can never hold more cards than the deck
+_POSITION_LABELS = tuple(f"#{i}" for i in range(sum(CARD_AMOUNTS.values())))
+# How often the notification timer checks its dismiss deadline (seconds)
+_NOTIFICATION_CHECK_INTERVAL = 0.25
+
+
 class GameTable:
     """Manages the complete game table UI."""
 
@@ -38,13 +67,20 @@ class GameTable:
         self._opponents_container = None
         self._center_container = None
         self._player_hand_container = None
+        # Hand position -> rendered card element, for in-place selection toggles
+        self._hand_card_elems: Dict[int, ui.element] = {}
+        # (opponent name, position) -> rendered card element, for click-mode toggles
+        self._opp_card_elems: Dict[Tuple[str, int], ui.element] = {}
         self._status_label = None
         self._main_container = None
         self._notification_container = None
         self._notification_timer = None
+        self._notification_deadline: float = 0.0
         # Click-to-interact state
         self._clickable_mode: Optional[str] = None
         self._last_state: Optional[GameStateSnapshot] = None
+        # Player name -> hand DOM ID, rebuilt whenever _last_state changes
+        self._hand_id_cache: Dict[str, str] = {}
         # Highlight state for newly placed card after multi-exchange
         self._new_card_index: Optional[int] = None
         self._compaction_active: bool = False
@@ -53,6 +89,9 @@ class GameTable:
         self._animating: bool = False
         self._pending_state: Optional[GameStateSnapshot] = None
         self._animation_overlay = None
+        # Signature of the last rendered snapshot (skips no-op re-renders)
+        self._last_snap_sig: Optional[tuple] = None
+        self._player_hand_label: Optional[ui.label] = None
 
     def build(self) -> None:
         """Create the full game table layout."""
@@ -572,9 +611,18 @@ class GameTable:
         if not self._main_container:
             return
 
-        # Defer state updates while animations are playing
+        # Defer state updates while animations are playing; only the freshest
+        # snapshot is kept, and none if it matches what is already rendered
         if self._animating:
-            self._pending_state = state
+            if self._snap_sig(state) == self._last_snap_sig:
+                self._pending_state = None
+            else:
+                self._pending_state = state
+            return
+
+        # Nothing visible changed since the last render
+        snap_sig = self._snap_sig(state)
+        if snap_sig == self._last_snap_sig:
             return
 
         # Detect changes for animations
@@ -585,6 +633,11 @@ class GameTable:
                     prev_hand_count = len(p.cards)
                     break
         self._last_state = state
+        self._hand_id_cache = {
+            p.name: ("kabo-hand-self" if p.is_current_player
+                     else f"kabo-hand-{p.name}")
+            for p in state.players
+        }
 
         # Detect new card placement highlight from multi-exchange
         if (state.input_request and
@@ -598,6 +651,7 @@ class GameTable:
         # Handle round_over phase with summary display
         if state.phase == "round_over" and state.round_summary:
             self._show_round_summary(state)
+            self._last_snap_sig = snap_sig
             return
 
         # Update status
@@ -641,29 +695,18 @@ class GameTable:
                 opponent_views.append(p)
 
         # Determine clickable mode from input request
-        self._clickable_mode = None
-        if state.input_request:
-            rt = state.input_request.request_type
-            if rt == "pick_turn_type":
-                self._clickable_mode = "pick_turn_type"
-            elif rt == "decide_on_card_use":
-                self._clickable_mode = "decide_on_card_use"
-            elif rt in ("pick_hand_cards_for_exchange", "pick_cards_to_see"):
-                self._clickable_mode = rt
-            elif rt == "specify_spying":
-                self._clickable_mode = "specify_spying"
-            elif rt == "specify_swap":
-                self._clickable_mode = "specify_swap_own"
+        self._clickable_mode = (
+            _REQUEST_TYPE_TO_CLICKABLE.get(state.input_request.request_type)
+            if state.input_request else None
+        )
 
         # Render opponents (clickable in spy/swap modes, with turn indicator)
-        opponents_clickable = self._clickable_mode in (
-            "specify_spying", "specify_swap_opponent"
-        )
+        opponents_clickable = self._clickable_mode in _OPP_CLICKABLE_MODES
         revealed_map = self._get_revealed_cards_map(state)
-        self._revealed_map = revealed_map
 
         if self._opponents_container:
             self._opponents_container.clear()
+            self._opp_card_elems = {}
             with self._opponents_container:
                 for opp in opponent_views:
                     is_active = (opp.name == state.active_turn_player_name)
@@ -692,15 +735,12 @@ class GameTable:
                 )
 
         # Render player's hand
-        hand_clickable = self._clickable_mode in (
-            "decide_on_card_use",
-            "pick_hand_cards_for_exchange", "pick_cards_to_see",
-            "specify_swap_own",
-        )
+        hand_clickable = self._clickable_mode in _HAND_CLICKABLE_MODES
         cur_hand_count = len(web_player_view.cards) if web_player_view else 0
         hand_changed = (cur_hand_count != prev_hand_count and prev_hand_count > 0)
         if self._player_hand_container:
             self._player_hand_container.clear()
+            self._hand_card_elems = {}
             with self._player_hand_container:
                 if web_player_view:
                     for idx, card in enumerate(web_player_view.cards):
@@ -723,9 +763,9 @@ class GameTable:
                                 is_known=True,
                                 is_publicly_visible=False,
                             )
-                        render_card(
+                        self._hand_card_elems[card.position] = render_card(
                             display_card, size="normal",
-                            label=f"#{card.position}",
+                            label=_POSITION_LABELS[card.position],
                             clickable=hand_clickable,
                             selected=selected,
                             animate=anim,
@@ -738,7 +778,7 @@ class GameTable:
         is_my_turn = (
             state.active_turn_player_name == state.current_player_name
         )
-        if hasattr(self, "_player_hand_label") and self._player_hand_label:
+        if self._player_hand_label is not None:
             if is_my_turn:
                 self._player_hand_label.set_text("Your Hand - YOUR TURN!")
                 self._player_hand_label.classes(
@@ -752,6 +792,16 @@ class GameTable:
 
         # Update scoreboard
         self.scoreboard.update(state.players)
+        self._last_snap_sig = snap_sig
+
+    @staticmethod
+    def _snap_sig(state: GameStateSnapshot) -> tuple:
+        """Cheap signature of everything update_state renders.
+
+        The input request is a frozen dataclass and is compared by value,
+        so a rebuilt but identical request does not force a re-render.
+        """
+        return state.view_key(), state.input_request
 
     def _render_opponent_hand(self, opponent: PlayerView,
                               clickable: bool = False,
@@ -790,53 +840,17 @@ class GameTable:
                             is_known=True,
                             is_publicly_visible=False,
                         )
-                    render_card(
+                    # Handler is always attached; clicks outside spy/swap
+                    # modes are ignored by _on_opponent_card_click
+                    self._opp_card_elems[(opponent.name, card.position)] = render_card(
                         display_card, size="small",
                         clickable=clickable,
                         on_click=(
                             lambda n=opponent.name, idx=card.position:
                                 self._on_opponent_card_click(n, idx)
-                        ) if clickable else None,
+                        ),
                     )
 
-    def _rerender_player_hand(self, state: GameStateSnapshot) -> None:
-        """Re-render just the player's hand cards (for selection updates)."""
-        web_player_view = None
-        for p in state.players:
-            if p.is_current_player:
-                web_player_view = p
-                break
-        if not web_player_view or not self._player_hand_container:
-            return
-        hand_clickable = self._clickable_mode in (
-            "decide_on_card_use",
-            "pick_hand_cards_for_exchange", "pick_cards_to_see",
-            "specify_swap_own",
-        )
-        revealed_map = getattr(self, "_revealed_map", {})
-        self._player_hand_container.clear()
-        with self._player_hand_container:
-            for card in web_player_view.cards:
-                selected = card.position in self.action_panel._selected_cards
-                display_card = card
-                reveal_key = (web_player_view.name, card.position)
-                if reveal_key in revealed_map:
-                    display_card = CardView(
-                        position=card.position,
-                        value=revealed_map[reveal_key],
-                        is_known=True,
-                        is_publicly_visible=False,
-                    )
-                render_card(
-                    display_card, size="normal",
-                    label=f"#{card.position}",
-                    clickable=hand_clickable,
-                    selected=selected,
-                    on_click=(
-                        lambda p=card.position: self._on_hand_card_click(p)
-                    ) if hand_clickable else None,
-                )
-
     def _on_deck_click(self) -> None:
         """Handle click on the deck - submit HIT_DECK."""
         self._clickable_mode = None
@@ -849,25 +863,26 @@ class GameTable:
 
     def _on_hand_card_click(self, position: int) -> None:
         """Handle click on a hand card - toggle selection or submit position."""
+        before = set(self.action_panel._selected_cards)
         if self._clickable_mode == "decide_on_card_use":
             self.action_panel._toggle_card_selection_for_keep(position)
-            if self._last_state:
-                self._rerender_player_hand(self._last_state)
         elif self._clickable_mode == "pick_hand_cards_for_exchange":
             self.action_panel._toggle_card_selection(position)
-            if self._last_state:
-                self._rerender_player_hand(self._last_state)
         elif self._clickable_mode == "pick_cards_to_see":
             num_to_see = 1
             if self.action_panel._current_request:
                 num_to_see = self.action_panel._current_request.extra.get(
                     "num_cards_to_see", 1)
             self.action_panel._toggle_peek_selection(position, num_to_see)
-            # Re-render hand to show updated selection highlight
-            if self._last_state:
-                self._rerender_player_hand(self._last_state)
         elif self._clickable_mode == "specify_swap_own":
             self.action_panel.select_swap_own(position)
+            return
+        # Update the highlight only on cards whose selection changed
+        after = set(self.action_panel._selected_cards)
+        for pos in before ^ after:
+            elem = self._hand_card_elems.get(pos)
+            if elem is not None:
+                set_card_selected(elem, pos in after)
 
     def _on_opponent_card_click(self, opponent_name: str, card_idx: int) -> None:
         """Handle click on an opponent's card — for spy or swap."""
@@ -882,22 +897,13 @@ class GameTable:
             self.action_panel.complete_swap(opponent_name, card_idx)
 
     def _render_opponents_for_mode(self, state: GameStateSnapshot) -> None:
-        """Re-render opponents section with current clickable mode."""
-        opponent_views = [p for p in state.players if not p.is_current_player]
-        opponents_clickable = self._clickable_mode in (
-            "specify_spying", "specify_swap_opponent"
-        )
-        revealed_map = getattr(self, "_revealed_map", {})
-        if self._opponents_container:
-            self._opponents_container.clear()
-            with self._opponents_container:
-                for opp in opponent_views:
-                    is_active = (opp.name == state.active_turn_player_name)
-                    self._render_opponent_hand(
-                        opp, clickable=opponents_clickable,
-                        is_active_turn=is_active,
-                        revealed_map=revealed_map,
-                    )
+        """Update opponent cards' click styling for the current clickable mode.
+
+        The cards already carry their click handlers, so only CSS classes change.
+        """
+        opponents_clickable = self._clickable_mode in _OPP_CLICKABLE_MODES
+        for elem in self._opp_card_elems.values():
+            set_card_clickable(elem, opponents_clickable)
 
     def show_notification(self, notification: TurnNotification) -> None:
         """Display an animated notification banner."""
@@ -934,20 +940,24 @@ class GameTable:
             "kabo_called": 5000,
         }.get(notification.notification_type, 3000)
 
-        # Cancel previous dismiss timer
-        if self._notification_timer:
-            self._notification_timer.deactivate()
-
-        self._notification_timer = ui.timer(
-            dismiss_ms / 1000.0, self._dismiss_notification, once=True
-        )
+        # Push back the dismiss deadline; one timer, created on first use,
+        # checks it and is only active while a notification is showing
+        self._notification_deadline = time.monotonic() + dismiss_ms / 1000.0
+        if self._notification_timer is None:
+            self._notification_timer = ui.timer(
+                _NOTIFICATION_CHECK_INTERVAL, self._dismiss_notification
+            )
+        else:
+            self._notification_timer.activate()
 
     def _dismiss_notification(self) -> None:
-        """Hide the notification container."""
+        """Hide the notification container once its deadline has passed."""
+        if time.monotonic() < self._notification_deadline:
+            return
         if self._notification_container:
             self._notification_container.classes(add="hidden")
             self._notification_container.clear()
-        self._notification_timer = None
+        self._notification_timer.deactivate()
 
     def _show_round_summary(self, state: GameStateSnapshot) -> None:
         """Display round-end summary with all cards revealed and scores."""
@@ -969,6 +979,7 @@ class GameTable:
         # Show all players' revealed hands (opponents section)
         if self._opponents_container:
             self._opponents_container.clear()
+            self._opp_card_elems = {}
             with self._opponents_container:
                 for pv in state.players:
                     if not pv.is_current_player:
@@ -982,36 +993,35 @@ class GameTable:
                     ui.label("Round Scores").classes(
                         "text-lg font-bold text-yellow-300 mb-2"
                     )
-                    for name, score in sorted(
-                        summary.round_scores.items(), key=lambda x: x[1]
-                    ):
-                        game_total = summary.game_scores.get(name, 0)
-                        with ui.row().classes("items-center gap-2 w-full"):
-                            ui.label(name).classes("text-white font-bold w-24")
-                            ui.label(f"+{score}").classes("text-yellow-300")
-                            ui.label(f"(Total: {game_total})").classes(
-                                "text-gray-400 text-sm"
-                            )
+                    # One pre-assembled HTML block instead of a row + 3 labels per player
+                    ui.html("".join(
+                        '<div class="flex items-center gap-2 w-full">'
+                        f'<span class="text-white font-bold w-24">{html.escape(name)}</span>'
+                        f'<span class="text-yellow-300">+{score}</span>'
+                        '<span class="text-gray-400 text-sm">'
+                        f'(Total: {summary.game_scores.get(name, 0)})</span>'
+                        '</div>'
+                        for name, score in sorted(
+                            summary.round_scores.items(), key=lambda x: x[1]
+                        )
+                    ))
 
         # Show the current player's revealed hand
         if self._player_hand_container:
             self._player_hand_container.clear()
+            self._hand_card_elems = {}
             with self._player_hand_container:
                 web_pv = next((p for p in state.players if p.is_current_player), None)
                 if web_pv:
                     for card in web_pv.cards:
-                        render_card(card, size="normal", label=f"#{card.position}")
+                        render_card(card, size="normal", label=_POSITION_LABELS[card.position])
 
         # Update scoreboard
         self.scoreboard.update(state.players)
 
     def _hand_id(self, player_name: str) -> str:
         """Map a player name to its DOM ID, accounting for 'self' player."""
-        if self._last_state:
-            for p in self._last_state.players:
-                if p.is_current_player and p.name == player_name:
-                    return "kabo-hand-self"
-        return f"kabo-hand-{player_name}"
+        return self._hand_id_cache.get(player_name, f"kabo-hand-{player_name}")
 
     def enqueue_animation(self, event: AnimationEvent) -> None:
         """Add an animation event to the queue and start playback."""
@@ -1023,9 +1033,9 @@ class GameTable:
         """Play the next animation in the queue."""
         if not self._animation_queue:
             self._animating = False
-            if self._pending_state:
-                state = self._pending_state
-                self._pending_state = None
+            state = self._pending_state
+            self._pending_state = None
+            if state is not None and self._snap_sig(state) != self._last_snap_sig:
                 self.update_state(state)
             return
 
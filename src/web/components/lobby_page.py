@@ -4,6 +4,8 @@ Lobby page - landing page with solo play, create room, and join room options.
 from nicegui import ui
 from typing import Callable
 
+from src.web.components.utils import debounce
+
 
 def render_lobby_page(on_solo: Callable, on_create_room: Callable,
                       on_join_room: Callable) -> None:
@@ -44,17 +46,17 @@ def render_lobby_page(on_solo: Callable, on_create_room: Callable,
         max_label = ui.label("Max human players: 4").classes(
             "text-sm text-gray-400 mb-1"
         )
-        max_slider.on_value_change(
+        max_slider.on_value_change(debounce(
             lambda e: max_label.set_text(f"Max human players: {int(e.value)}")
-        )
+        ))
 
         ai_slider = ui.slider(min=0, max=3, value=0, step=1).classes("w-full")
         ai_label = ui.label("AI opponents: 0").classes(
             "text-sm text-gray-400 mb-2"
         )
-        ai_slider.on_value_change(
+        ai_slider.on_value_change(debounce(
             lambda e: ai_label.set_text(f"AI opponents: {int(e.value)}")
-        )
+        ))
 
         revelations_switch = ui.switch(
             "Show card values in game log", value=False
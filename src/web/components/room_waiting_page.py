@@ -2,11 +2,70 @@
 Room waiting page - displayed after creating/joining a room, before the game starts.
 Shows connected players, room code, and start button for the host.
 """
+import json
+from collections import OrderedDict
+
 from nicegui import ui
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Track auto-start per room to prevent multiple triggers. Insertion-ordered
+# and capped so codes of long-finished rooms don't accumulate.
+_auto_started_rooms: "OrderedDict[str, None]" = OrderedDict()
+_AUTO_STARTED_ROOMS_MAX = 1024
+
+
+def _mark_auto_started(room_code: str) -> None:
+    _auto_started_rooms[room_code] = None
+    while len(_auto_started_rooms) > _AUTO_STARTED_ROOMS_MAX:
+        _auto_started_rooms.popitem(last=False)
+
+
+def forget_room(room_code: str) -> None:
+    """Drop any auto-start bookkeeping for a room that is being removed."""
+    _auto_started_rooms.pop(room_code.upper(), None)
+
+# Player rows beyond this many are summarised instead of rendered, which
+# keeps the DOM bounded if rooms ever grow past a handful of players
+_MAX_RENDERED_PLAYERS = 20
+
+# AI seat names, matching GameSession's "AI_<n>" naming (at most 3 AI seats)
+_AI_LABELS = tuple(f"AI_{i + 1}" for i in range(4))
+
 
-# Track auto-start per room to prevent multiple triggers
-_auto_started_rooms: set = set()
+def _player_label(pname: str, host_name: Optional[str]) -> str:
+    return f"{pname} (Host)" if pname == host_name else pname
+
+
+def _render_player_list(column: ui.column,
+                        rows: Dict[str, Tuple[ui.row, ui.label]],
+                        names, host_name: Optional[str],
+                        overflow_label: ui.label,
+                        limit: int = _MAX_RENDERED_PLAYERS) -> None:
+    """Diff the player rows in ``column`` against ``names``.
+
+    ``rows`` maps rendered names to their (row, label) handles and is
+    updated in place. Only the first ``limit`` players get a row; the rest
+    are counted in ``overflow_label``.
+    """
+    shown = names[:limit]
+    for pname in set(rows) - set(shown):
+        rows.pop(pname)[0].delete()
+    for pname in shown:
+        if pname in rows:
+            rows[pname][1].set_text(_player_label(pname, host_name))
+            continue
+        with column:
+            with ui.row().classes("items-center gap-2") as row:
+                ui.icon("person").classes("text-green-400")
+                label = ui.label(
+                    _player_label(pname, host_name)
+                ).classes("text-white")
+        rows[pname] = (row, label)
+
+    hidden = len(names) - len(shown)
+    if hidden:
+        overflow_label.set_text(f"+{hidden} more")
+    overflow_label.set_visibility(hidden > 0)
 
 
 def render_room_waiting_page(room_code: str, player_name: str,
@@ -14,7 +73,9 @@ def render_room_waiting_page(room_code: str, player_name: str,
                              get_room_info: Callable,
                              on_start: Callable,
                              on_leave: Callable,
-                             join_url: str = "") -> ui.column:
+                             join_url: str = "",
+                             subscribe_updates: Optional[Callable] = None,
+                             ) -> ui.column:
     """Render the waiting room page.
 
     Args:
@@ -22,8 +83,13 @@ def render_room_waiting_page(room_code: str, player_name: str,
         player_name: this player's name (uppercased)
         is_host: whether this player is the host
         get_room_info: callback() -> dict with keys: players, max_players, ai_count, state
-        on_start: callback() - host starts the game
+        on_start: callback() -> bool - host starts the game; returns False
+            if the start failed (it reports the error itself)
         on_leave: callback() - player leaves the room
+        join_url: absolute shareable link to the room (empty to hide it)
+        subscribe_updates: callback(refresh) -> handler; registers ``refresh``
+            for pushed room updates and returns the handler to call with a
+            room info dict (defaults to ``refresh`` itself)
     """
     container = ui.column().classes("w-96 mx-auto mt-8 items-center")
 
@@ -51,15 +117,11 @@ def render_room_waiting_page(room_code: str, player_name: str,
                         "flex-grow"
                     ).props("outlined dense dark readonly")
 
-                    async def _set_full_url():
-                        origin = await ui.run_javascript('window.location.origin')
-                        link_input.value = f'{origin}{join_url}'
-
-                    ui.timer(0.5, _set_full_url, once=True)
-
+                    # Copy via a temporary textarea: navigator.clipboard is
+                    # unavailable on plain-http deployments
                     copy_js = (
                         'function(){var t=document.createElement("textarea");'
-                        't.value=window.location.origin+"' + join_url + '";'
+                        't.value=' + json.dumps(link_input.value) + ';'
                         't.style.position="fixed";t.style.left="-9999px";'
                         'document.body.appendChild(t);t.select();'
                         'document.execCommand("copy");document.body.removeChild(t)}'
@@ -78,6 +140,12 @@ def render_room_waiting_page(room_code: str, player_name: str,
         # Players list
         players_card = ui.card().classes("w-full p-4 mb-4")
         players_container = ui.column().classes("w-full")
+        with players_container:
+            humans_column = ui.column().classes("w-full")
+            overflow_label = ui.label("").classes("text-gray-400 italic")
+            overflow_label.set_visibility(False)
+            ai_column = ui.column().classes("w-full")
+            empty_column = ui.column().classes("w-full")
 
         # Settings display
         settings_label = ui.label("").classes(
@@ -85,10 +153,20 @@ def render_room_waiting_page(room_code: str, player_name: str,
         )
 
         # Start / Leave buttons
+        started = False
+
+        def start_once():
+            """Start the game at most once (button or auto-start timer)."""
+            nonlocal started
+            if started:
+                return
+            # Stay armed after a failed start so the host can retry
+            started = bool(on_start())
+
         start_btn = None
         if is_host:
             start_btn = ui.button(
-                "Start Game", on_click=on_start
+                "Start Game", on_click=start_once
             ).classes("w-full mb-2").props("color=positive size=lg")
             start_btn.disable()
 
@@ -101,58 +179,72 @@ def render_room_waiting_page(room_code: str, player_name: str,
             "text-sm text-gray-500 mt-2"
         )
 
-    def refresh():
-        """Poll room state and update UI."""
-        try:
-            info = get_room_info()
-        except Exception:
-            return
+    # Rendered player rows: name -> (row, label); AI / empty slot rows are
+    # created once and toggled with set_visibility
+    player_rows: Dict[str, Tuple[ui.row, ui.label]] = {}
+    ai_rows: List[ui.row] = []
+    empty_rows: List[ui.row] = []
+    last_render: Optional[tuple] = None
+    auto_start_timer: Optional[ui.timer] = None
+    settings_text = ""
 
-        if info is None:
-            return
+    def refresh(info: dict):
+        """Update the UI from a room info dict."""
+        nonlocal last_render, auto_start_timer, settings_text
 
         # If game started, the app.py handler will switch to game view
         if info["state"] == "playing":
             status_label.set_text("Game starting!")
+            keepalive_timer.deactivate()
             return
 
         player_names = info["players"]
         max_p = info["max_players"]
         ai_c = info["ai_count"]
+        host_name = info.get("host_name")
+        show_rev = info.get("show_revelations", False)
+
+        key = (tuple(player_names), ai_c, max_p, host_name, show_rev,
+               info["state"])
+        if key == last_render:
+            return
+        last_render = key
 
         # Update settings label
-        show_rev = info.get("show_revelations", False)
         rev_text = " | Card values in log: ON" if show_rev else " | Card values in log: OFF"
-        settings_label.set_text(
+        text = (
             f"Players: {len(player_names)}/{max_p} humans"
             + (f" + {ai_c} AI" if ai_c else "")
             + rev_text
         )
+        if text != settings_text:
+            settings_text = text
+            settings_label.set_text(text)
 
-        # Update players list
-        with players_card:
-            players_container.clear()
-            with players_container:
-                for pname in player_names:
-                    with ui.row().classes("items-center gap-2"):
-                        ui.icon("person").classes("text-green-400")
-                        label = pname
-                        if pname == info.get("host_name"):
-                            label += " (Host)"
-                        ui.label(label).classes("text-white")
-
-                # Show AI slots
-                for i in range(ai_c):
-                    with ui.row().classes("items-center gap-2"):
-                        ui.icon("smart_toy").classes("text-blue-400")
-                        ui.label(f"AI_{i + 1}").classes("text-gray-400")
-
-                # Show empty slots
-                empty = max_p - len(player_names)
-                for _ in range(empty):
-                    with ui.row().classes("items-center gap-2"):
-                        ui.icon("person_outline").classes("text-gray-600")
-                        ui.label("Waiting...").classes("text-gray-600 italic")
+        # Update players list: drop rows of players who left, add new ones
+        _render_player_list(humans_column, player_rows, player_names,
+                            host_name, overflow_label)
+
+        # Show AI slots
+        with ai_column:
+            for i in range(len(ai_rows), ai_c):
+                with ui.row().classes("items-center gap-2") as row:
+                    ui.icon("smart_toy").classes("text-blue-400")
+                    ui.label(_AI_LABELS[i]).classes("text-gray-400")
+                ai_rows.append(row)
+        for i, row in enumerate(ai_rows):
+            row.set_visibility(i < ai_c)
+
+        # Show empty slots
+        empty = max_p - len(player_names)
+        with empty_column:
+            for _ in range(len(empty_rows), empty):
+                with ui.row().classes("items-center gap-2") as row:
+                    ui.icon("person_outline").classes("text-gray-600")
+                    ui.label("Waiting...").classes("text-gray-600 italic")
+                empty_rows.append(row)
+        for i, row in enumerate(empty_rows):
+            row.set_visibility(i < empty)
 
         # Enable start button when enough players
         total = len(player_names) + ai_c
@@ -166,13 +258,30 @@ def render_room_waiting_page(room_code: str, player_name: str,
         if (is_host
                 and len(player_names) >= max_p
                 and room_code not in _auto_started_rooms):
-            _auto_started_rooms.add(room_code)
+            _mark_auto_started(room_code)
             status_label.set_text("All players joined! Starting in 2s...")
-            ui.timer(2.0, on_start, once=True)
+            auto_start_timer = ui.timer(2.0, start_once, once=True)
+        elif auto_start_timer is not None and len(player_names) < max_p:
+            # Someone left during the countdown: cancel it and re-arm
+            auto_start_timer.deactivate()
+            auto_start_timer = None
+            _auto_started_rooms.pop(room_code, None)
+            status_label.set_text("Waiting for players...")
+
+    update = subscribe_updates(refresh) if subscribe_updates else refresh
+
+    def keepalive():
+        """Re-read room state in case a pushed update was missed."""
+        try:
+            info = get_room_info()
+        except Exception:
+            return
+        if info is not None:
+            update(info)
 
-    # Poll every second
-    ui.timer(1.0, refresh)
+    # Room changes are pushed; this slow timer is only a safety net
+    keepalive_timer = ui.timer(10.0, keepalive)
     # Initial render
-    refresh()
+    keepalive()
 
     return container
@@ -2,7 +2,7 @@
 Scoreboard component - displays player scores.
 """
 from nicegui import ui
-from typing import List
+from typing import Dict, List, Tuple
 from src.web.game_state import PlayerView
 
 
@@ -11,23 +11,67 @@ class Scoreboard:
 
     def __init__(self):
         self._container = None
+        # Per-player row handles and the (name text, is current, score)
+        # values they currently show, so update() only touches what changed
+        self._rows: Dict[str, Tuple[ui.row, ui.label, ui.label]] = {}
+        self._row_values: Dict[str, Tuple[str, bool, int]] = {}
+        self._order: List[str] = []
 
     def build(self) -> None:
         """Create the scoreboard UI element."""
         self._container = ui.card().classes("w-full")
         with self._container:
             ui.label("Scores").classes("text-sm font-bold text-gray-300")
+        self._rows = {}
+        self._row_values = {}
+        self._order = []
+
+    @staticmethod
+    def _name_classes(is_current_player: bool) -> str:
+        name_style = "font-bold text-yellow-300" if is_current_player else "text-gray-300"
+        return f"text-sm {name_style}"
 
     def update(self, players: List[PlayerView]) -> None:
         """Update the scoreboard with current player data."""
         if not self._container:
             return
-        self._container.clear()
-        with self._container:
-            ui.label("Scores").classes("text-sm font-bold text-gray-300")
-            for p in sorted(players, key=lambda x: x.game_score):
-                kabo_badge = " [KABO]" if p.called_kabo else ""
-                with ui.row().classes("items-center gap-2 w-full"):
-                    name_style = "font-bold text-yellow-300" if p.is_current_player else "text-gray-300"
-                    ui.label(f"{p.name}{kabo_badge}").classes(f"text-sm {name_style}")
-                    ui.label(str(p.game_score)).classes("text-sm text-white ml-auto")
+        ordered = sorted(players, key=lambda x: x.game_score)
+        order = [p.name for p in ordered]
+
+        # Drop rows of players who are gone
+        for name in set(self._rows) - set(order):
+            self._rows.pop(name)[0].delete()
+            del self._row_values[name]
+
+        for p in ordered:
+            kabo_badge = " [KABO]" if p.called_kabo else ""
+            values = (f"{p.name}{kabo_badge}", p.is_current_player, p.game_score)
+            entry = self._rows.get(p.name)
+            if entry is None:
+                with self._container:
+                    with ui.row().classes("items-center gap-2 w-full") as row:
+                        name_label = ui.label(values[0]).classes(
+                            self._name_classes(p.is_current_player))
+                        score_label = ui.label(str(p.game_score)).classes(
+                            "text-sm text-white ml-auto")
+                self._rows[p.name] = (row, name_label, score_label)
+                self._row_values[p.name] = values
+                continue
+
+            old = self._row_values[p.name]
+            if old == values:
+                continue
+            _, name_label, score_label = entry
+            if old[0] != values[0]:
+                name_label.set_text(values[0])
+            if old[1] != values[1]:
+                name_label.classes(replace=self._name_classes(values[1]))
+            if old[2] != values[2]:
+                score_label.set_text(str(values[2]))
+            self._row_values[p.name] = values
+
+        # Re-sort rows only when the ranking changed (index 0 is the title)
+        if order != self._order:
+            for i, name in enumerate(order, start=1):
+                self._rows[name][0].move(target_index=i)
+            self._order = order
@@ -4,6 +4,8 @@ Setup page - game configuration form before starting a game.
 from nicegui import ui
 from typing import Callable
 
+from src.web.components.utils import debounce
+
 
 def render_setup_page(on_start: Callable) -> None:
     """Render the game setup form.
@@ -24,9 +26,9 @@ def render_setup_page(on_start: Callable) -> None:
 
         ai_slider = ui.slider(min=1, max=3, value=1, step=1).classes("w-full")
         ai_label = ui.label("AI opponents: 1").classes("text-sm text-gray-400 mb-4")
-        ai_slider.on_value_change(
+        ai_slider.on_value_change(debounce(
             lambda e: ai_label.set_text(f"AI opponents: {int(e.value)}")
-        )
+        ))
 
         def start_game():
             name = name_input.value.strip()
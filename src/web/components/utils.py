@@ -0,0 +1,33 @@
+"""
+Small helpers shared by the page components.
+"""
+from nicegui import ui
+from typing import Callable
+
+
+def debounce(fn: Callable, ms: int = 150) -> Callable:
+    """Rate-limit ``fn`` for high-frequency UI events such as slider drags.
+
+    The first call runs immediately and opens a ``ms`` window; calls made
+    inside the window are collapsed into one trailing call with the latest
+    arguments when the window closes.
+    """
+    window = None
+    pending = None
+
+    def _close_window():
+        nonlocal window, pending
+        window = None
+        if pending is not None:
+            args, pending = pending, None
+            fn(*args)
+
+    def wrapper(*args):
+        nonlocal window, pending
+        if window is None:
+            fn(*args)
+            window = ui.timer(ms / 1000, _close_window, once=True)
+        else:
+            pending = args
+
+    return wrapper
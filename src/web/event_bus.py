@@ -4,39 +4,102 @@ Thread-safe pub/sub event bus for bridging the game thread and the NiceGUI UI.
 The game thread emits events (state updates, input requests, log messages).
 The UI subscribes to events and updates accordingly.
 """
+import logging
 import threading
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
+
+_log = logging.getLogger(__name__)
 
 
 class EventBus:
-    """Simple thread-safe publish/subscribe event bus."""
+    """Simple thread-safe publish/subscribe event bus.
+
+    Subscriber lists are copy-on-write: subscribe/unsubscribe build a new
+    dict of tuples under the lock and swap it in with a single assignment,
+    so emit() can read it without locking.
+    """
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
         self._lock = threading.Lock()
 
     def subscribe(self, event_type: str, callback: Callable) -> None:
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(callback)
+            subscribers = self._subscribers
+            self._subscribers = {
+                **subscribers,
+                event_type: subscribers.get(event_type, ()) + (callback,),
+            }
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         with self._lock:
-            if event_type in self._subscribers:
-                self._subscribers[event_type] = [
-                    cb for cb in self._subscribers[event_type] if cb != callback
-                ]
+            subscribers = self._subscribers
+            if event_type in subscribers:
+                self._subscribers = {
+                    **subscribers,
+                    event_type: tuple(
+                        cb for cb in subscribers[event_type] if cb != callback
+                    ),
+                }
+
+    def subscriber_count(self, event_type: str) -> int:
+        """Number of callbacks subscribed to ``event_type`` (lock-free)."""
+        return len(self._subscribers.get(event_type, ()))
 
     def emit(self, event_type: str, data: Any = None) -> None:
-        with self._lock:
-            callbacks = list(self._subscribers.get(event_type, []))
-        for callback in callbacks:
+        for callback in self._subscribers.get(event_type, ()):
             try:
                 callback(data)
-            except Exception as e:
-                print(f"[EventBus] Error in callback for '{event_type}': {e}")
+            except Exception:
+                _log.exception("Error in callback for '%s'", event_type)
 
     def clear(self) -> None:
         with self._lock:
-            self._subscribers.clear()
+            self._subscribers = {}
+
+
+class MultiplexBus(EventBus):
+    """An EventBus that forwards everything to a set of child buses.
+
+    Lets a producer that feeds every player of a room (such as the game's
+    log capture) emit once instead of looping over the buses itself.
+    Subscribing to the multiplexer subscribes to every child.
+    """
+
+    def __init__(self, children: List[EventBus]):
+        super().__init__()
+        self.set_children(children)
+
+    def set_children(self, children: List[EventBus]) -> None:
+        """Replace the child buses (e.g. after a player reconnects)."""
+        self._children = tuple(children)
+        # Bound methods, so emit() does no attribute lookups per child
+        self._emits = tuple(bus.emit for bus in self._children)
+
+    def subscribe(self, event_type: str, callback: Callable) -> None:
+        for bus in self._children:
+            bus.subscribe(event_type, callback)
+
+    def unsubscribe(self, event_type: str, callback: Callable) -> None:
+        for bus in self._children:
+            bus.unsubscribe(event_type, callback)
+
+    def subscriber_count(self, event_type: str) -> int:
+        return sum(bus.subscriber_count(event_type) for bus in self._children)
+
+    def emit(self, event_type: str, data: Any = None) -> None:
+        emits = self._emits
+        sent = 0
+        # One try around the loop; a failing child is skipped, not retried
+        while sent < len(emits):
+            try:
+                for emit in emits[sent:]:
+                    sent += 1
+                    emit(event_type, data)
+            except Exception:
+                _log.exception("Error forwarding '%s' to a child bus",
+                               event_type)
+
+    def clear(self) -> None:
+        for bus in self._children:
+            bus.clear()
@@ -4,14 +4,48 @@ GameRoom - manages a multiplayer lobby and shared game session.
 Players create or join rooms via short codes. When the host starts the game,
 a shared GameSession runs with one WebPlayer per browser and optional AI players.
 """
-import random
+import logging
+import secrets
 import string
+import sys
 import threading
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from src.web.event_bus import EventBus
 from src.web.game_state import GameStateSnapshot, InputRequest
 
+_log = logging.getLogger(__name__)
+
+# Error messages raised to the UI (shown via ui.notify)
+_ERR_GAME_STARTED = "Game already started"
+_ERR_ROOM_FULL = "Room is full"
+_ERR_NAME_TAKEN = "Name '{}' is already taken"
+_ERR_NOT_IN_ROOM = "Player '{}' not in room"
+_ERR_ROOM_NOT_FOUND = "Room not found"
+
+
+def _normalize_name(name: str) -> str:
+    """Canonical (upper-cased, interned) form of a player name.
+
+    Interning makes the players-dict lookups hit the identity fast path.
+    """
+    return sys.intern(name if name.isupper() else name.upper())
+
+
+# GameSession pulls in the whole game engine, so it is imported on the
+# first start_game() and cached here rather than at module import time
+_GameSession = None
+
+
+def _get_session_cls():
+    """Return the GameSession class, importing it on first use."""
+    global _GameSession
+    if _GameSession is None:
+        from src.web.game_session import GameSession
+        _GameSession = GameSession
+    return _GameSession
+
 
 class GameRoom:
     """A multiplayer game room that holds player slots and manages shared game state."""
@@ -20,7 +54,7 @@ class GameRoom:
                  max_players: int = 4, ai_count: int = 0,
                  show_revelations: bool = False):
         self.room_code = room_code
-        self.host_name = host_name.upper()
+        self.host_name = _normalize_name(host_name)
         self.max_players = max_players
         self.ai_count = ai_count
         self.show_revelations = show_revelations
@@ -29,41 +63,95 @@ class GameRoom:
         self.players: Dict[str, dict] = {}
         self.session = None
         self._lock = threading.Lock()
+        # Immutable views of self.players for the broadcast paths, rebuilt
+        # by the mutators under the lock and read without it
+        self._players_cache: Tuple[Tuple[str, dict], ...] = ()
+        self._bus_cache: Tuple[EventBus, ...] = ()
+        self._named_buses: Tuple[Tuple[str, EventBus], ...] = ()
+        # Room-wide bus for lobby changes, separate from the per-player buses
+        self.room_bus = EventBus()
+        # Read-only lobby info, rebuilt by the mutators (None = stale)
+        self._info_cache: Optional[Mapping[str, Any]] = None
+        # Per-player key of the last 'waiting' snapshot sent by
+        # broadcast_state_to_others, to skip re-sending an unchanged table
+        self._waiting_keys: Dict[str, tuple] = {}
+
+    def _snapshot(self) -> Mapping[str, Any]:
+        """Rebuild and cache the lobby info. Caller must hold ``self._lock``."""
+        self._info_cache = MappingProxyType({
+            "players": tuple(self.players),
+            "max_players": self.max_players,
+            "ai_count": self.ai_count,
+            "state": self.state,
+            "host_name": self.host_name,
+            "show_revelations": self.show_revelations,
+        })
+        return self._info_cache
+
+    def _refresh_caches(self) -> None:
+        """Rebuild the broadcast caches. Caller must hold ``self._lock``."""
+        self._players_cache = tuple(self.players.items())
+        self._named_buses = tuple((name, info["event_bus"])
+                                  for name, info in self.players.items()
+                                  if info["event_bus"] is not None)
+        self._bus_cache = tuple(bus for _, bus in self._named_buses)
+
+    def get_room_info(self) -> Mapping[str, Any]:
+        """Return the current lobby info (players, settings, state).
+
+        The result is a cached read-only mapping shared by all callers.
+        """
+        info = self._info_cache
+        if info is not None:
+            return info
+        with self._lock:
+            return self._snapshot()
 
     def add_player(self, name: str, event_bus: EventBus) -> None:
         """Add a human player to the room."""
-        uname = name.upper()
+        uname = _normalize_name(name)
+        slot = {"event_bus": event_bus, "web_player": None}
         with self._lock:
+            players = self.players
             if self.state != "waiting":
-                raise ValueError("Game already started")
-            if len(self.players) >= self.max_players:
-                raise ValueError("Room is full")
-            if uname in self.players:
-                raise ValueError(f"Name '{uname}' is already taken")
-            self.players[uname] = {"event_bus": event_bus, "web_player": None}
+                raise ValueError(_ERR_GAME_STARTED)
+            if len(players) >= self.max_players:
+                raise ValueError(_ERR_ROOM_FULL)
+            if uname in players:
+                raise ValueError(_ERR_NAME_TAKEN.format(uname))
+            players[uname] = slot
+            self._refresh_caches()
+            info = self._snapshot()
+        self.room_bus.emit("room_update", info)
 
     def remove_player(self, name: str) -> None:
         """Remove a player from the room."""
-        uname = name.upper()
+        uname = _normalize_name(name)
         with self._lock:
             self.players.pop(uname, None)
+            self._refresh_caches()
+            info = self._snapshot()
+        self.room_bus.emit("room_update", info)
 
     def reconnect_player(self, name: str, new_event_bus: EventBus) -> None:
         """Re-wire a player's EventBus after a browser refresh."""
-        uname = name.upper()
+        uname = _normalize_name(name)
         with self._lock:
             if uname not in self.players:
-                raise ValueError(f"Player '{uname}' not in room")
+                raise ValueError(_ERR_NOT_IN_ROOM.format(uname))
             self.players[uname]["event_bus"] = new_event_bus
             wp = self.players[uname].get("web_player")
             if wp:
                 wp.set_event_bus(new_event_bus)
+            self._refresh_caches()
+            info = self._snapshot()
+        if self.session is not None:
+            self.session.rebind_event_buses(self._bus_cache)
+        self.room_bus.emit("room_update", info)
 
     def get_all_event_buses(self) -> List[EventBus]:
         """Return all connected EventBuses."""
-        with self._lock:
-            return [info["event_bus"] for info in self.players.values()
-                    if info["event_bus"] is not None]
+        return list(self._bus_cache)
 
     def get_player_names(self) -> List[str]:
         """Return list of connected player names."""
@@ -79,7 +167,9 @@ class GameRoom:
 
     def broadcast_log(self, message: str) -> None:
         """Send a log message to all connected players."""
-        for bus in self.get_all_event_buses():
+        # Send batched game output first so the log stays in order
+        sys.stdout.flush()
+        for bus in self._bus_cache:
             try:
                 bus.emit("log", message)
             except Exception:
@@ -87,12 +177,14 @@ class GameRoom:
 
     def send_private_log(self, player_name: str, message: str) -> None:
         """Send a log message to a specific player only."""
-        uname = player_name.upper()
+        uname = _normalize_name(player_name)
         with self._lock:
             info = self.players.get(uname)
         if info:
             bus = info.get("event_bus")
             if bus:
+                # Send batched game output first so the log stays in order
+                sys.stdout.flush()
                 try:
                     bus.emit("log", message)
                 except Exception:
@@ -100,97 +192,120 @@ class GameRoom:
 
     def broadcast_game_over(self, data=None) -> None:
         """Send game_over to all connected players."""
-        for bus in self.get_all_event_buses():
+        for bus in self._bus_cache:
             try:
                 bus.emit("game_over", data)
             except Exception:
                 pass
 
-    def broadcast_state_to_others(self, active_player_name: str, _round) -> None:
+    def broadcast_state_to_others(self, active_player_name: str, _round,
+                                  shared: Optional[dict] = None) -> None:
         """Push a 'waiting' state snapshot to all non-active players.
 
         Each non-active WebPlayer builds its own perspective snapshot, then
-        we attach a 'waiting' InputRequest and emit to that player's EventBus.
+        we attach a 'waiting' InputRequest and emit both as a single
+        'turn_update' event on that player's EventBus. A player whose table
+        is unchanged since the last such broadcast (and whose UI has not
+        been sent anything else in between) is skipped.
+
+        ``shared`` is the caller's WebPlayer.build_shared_context() result
+        for ``_round``, if it already has one.
         """
-        with self._lock:
-            others = {name: info for name, info in self.players.items()
-                      if name != active_player_name}
+        others = tuple(entry for entry in self._players_cache
+                       if entry[0] != active_player_name)
 
-        for name, info in others.items():
+        # Viewer-independent snapshot parts, computed once for all recipients
+        for name, info in others:
             wp = info.get("web_player")
             bus = info.get("event_bus")
             if wp and bus and _round:
                 try:
-                    state = wp._build_state_snapshot(_round)
+                    if shared is None:
+                        shared = wp.shared_context(_round)
+                    state = wp._build_state_snapshot(_round, shared=shared)
                     state.active_turn_player_name = active_player_name
+                    key = (wp.state_version, state.view_key())
+                    if self._waiting_keys.get(name) == key:
+                        continue
+                    self._waiting_keys[name] = key
                     state.input_request = InputRequest(
                         request_type="waiting",
                         prompt=f"Waiting for {active_player_name}'s turn...",
-                        options=[],
+                        options=(),
                     )
-                    bus.emit("state_update", state)
-                    bus.emit("input_request", state.input_request)
-                except Exception as e:
-                    print(f"[GameRoom] Error broadcasting to {name}: {e}")
+                    bus.emit("turn_update", state)
+                except Exception:
+                    _log.exception("Error broadcasting to %s", name)
 
     def start_game(self):
         """Create WebPlayers, ComputerPlayers, and start the shared GameSession."""
-        from src.web.game_session import GameSession
-
         with self._lock:
             if self.state != "waiting":
-                raise ValueError("Game already started")
+                raise ValueError(_ERR_GAME_STARTED)
             self.state = "playing"
-
-        self.session = GameSession.from_room(self)
+            self._info_cache = None
+
+        try:
+            self.session = _get_session_cls().from_room(self)
+        except Exception:
+            # Reopen the room so the host can try again
+            with self._lock:
+                self.state = "waiting"
+                self._info_cache = None
+            raise
+        self.room_bus.emit("room_update", self.get_room_info())
         return self.session
 
+    def mark_finished(self) -> None:
+        """Flag the room's game as over (called from the game thread)."""
+        with self._lock:
+            self.state = "finished"
+            info = self._snapshot()
+        self.room_bus.emit("room_update", info)
+
 
 # --- Module-level room registry ---
 
+# Single dict operations (get / pop / setitem) are atomic under CPython's
+# GIL, so lookups and removals go without a lock; _rooms_lock only guards
+# the check-then-insert in create_room.
 _rooms: Dict[str, GameRoom] = {}
 _rooms_lock = threading.Lock()
 
-
-def _generate_code(length: int = 5) -> str:
-    """Generate a unique room code."""
-    chars = string.ascii_uppercase + string.digits
-    while True:
-        code = "".join(random.choices(chars, k=length))
-        if code not in _rooms:
-            return code
+_CODE_CHARS = string.ascii_uppercase + string.digits
+_CODE_LENGTH = 5
 
 
 def create_room(host_name: str, max_players: int = 4,
                 ai_count: int = 0,
                 show_revelations: bool = False) -> GameRoom:
     """Create a new room and add the host as the first player."""
-    with _rooms_lock:
-        code = _generate_code()
+    while True:
+        # Build the candidate outside the lock; only the insert is guarded
+        code = "".join(secrets.choice(_CODE_CHARS) for _ in range(_CODE_LENGTH))
         room = GameRoom(code, host_name, max_players, ai_count,
                         show_revelations=show_revelations)
-        _rooms[code] = room
-    return room
+        with _rooms_lock:
+            if code not in _rooms:
+                _rooms[code] = room
+                return room
 
 
 def join_room(code: str, player_name: str,
               event_bus: EventBus) -> GameRoom:
     """Join an existing room."""
-    with _rooms_lock:
-        room = _rooms.get(code.upper())
+    room = _rooms.get(code.upper())
     if not room:
-        raise ValueError("Room not found")
+        raise ValueError(_ERR_ROOM_NOT_FOUND)
     room.add_player(player_name, event_bus)
     return room
 
 
 def get_room(code: str) -> Optional[GameRoom]:
     """Look up a room by code."""
-    with _rooms_lock:
-        return _rooms.get(code.upper())
+    return _rooms.get(code.upper())
 
 
 def remove_room(code: str) -> None:
     """Remove a room from the registry."""
-    with _rooms_lock:
-        _rooms.pop(code.upper(), None)
+    _rooms.pop(code.upper(), None)
@@ -1,49 +1,252 @@
 """
 GameSession - manages a game running in a background thread.
 
-Creates players, runs Game.play_game() in a daemon thread, and captures
+Creates players, runs Game.play_game() on a pooled daemon thread, and captures
 print output via PrintInterceptor so it appears in the browser log.
 
 Supports both single-player (solo vs AI) and multiplayer (room-based) modes.
 """
 import io
+import logging
+import queue
 import sys
 import threading
-from typing import List, Optional
+from collections import deque
+from typing import Callable, Dict, List, Optional
 
 from src.card import Card
 from src.game import Game
-from src.web.event_bus import EventBus
+from src.player import Player
+from src.round import Round
+from src.web.event_bus import EventBus, MultiplexBus
 from src.web.web_player import WebPlayer
 from src.computer_player import ComputerPlayer
 from src.web.animation_computer_player import AnimationAwareComputerPlayer
 
+_log = logging.getLogger(__name__)
+
+
+class _GameRunnerPool:
+    """Reusable daemon threads for running game loops.
+
+    A game blocks its thread for as long as it waits on its human players,
+    so the pool is unbounded: a task goes to an idle worker when there is
+    one and a new worker is started otherwise. Workers exit after
+    ``idle_timeout`` seconds without work. Threads are daemons so a game
+    stuck waiting on an abandoned browser never blocks server shutdown.
+    """
+
+    def __init__(self, idle_timeout: float = 60.0):
+        self._idle_timeout = idle_timeout
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+
+    def submit(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            spawn = self._idle == 0
+            if not spawn:
+                self._idle -= 1
+            # Enqueue under the lock so an expiring worker can't miss it
+            self._tasks.put(fn)
+        if spawn:
+            threading.Thread(target=self._worker, daemon=True,
+                             name="kabo-game").start()
+
+    def _worker(self) -> None:
+        while True:
+            try:
+                fn = self._tasks.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._tasks.empty():
+                        self._idle -= 1
+                        return
+                continue
+            try:
+                fn()
+            except Exception:
+                # Keep the worker: it is about to be counted as idle
+                _log.exception("Game runner task failed")
+            # A BaseException ends the thread before it is counted as idle,
+            # so submit() will start a replacement instead of relying on it
+            with self._lock:
+                self._idle += 1
+
+
+_GAME_RUNNERS = _GameRunnerPool()
+
+
+class _LogBatcher:
+    """Coalesces log lines into one "log_batch" event.
+
+    Lines are flushed when ``max_batch_size`` accumulate, and otherwise by a
+    background thread every ``max_wait_ms``. A flush holding a single line
+    is sent as a plain "log" event.
+    """
+
+    def __init__(self, event_bus: EventBus,
+                 max_batch_size: int = 32, max_wait_ms: int = 50):
+        self._event_bus = event_bus
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._lines: deque = deque()
+        self._lock = threading.Lock()
+        # Serializes whole flushes so batches reach the bus in order
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            full = len(self._lines) >= self._max_batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                if not self._lines:
+                    return
+                lines = list(self._lines)
+                self._lines.clear()
+            if len(lines) == 1:
+                event_type, payload = "log", lines[0]
+            else:
+                event_type, payload = "log_batch", lines
+            self._event_bus.emit(event_type, payload)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._max_wait):
+            self.flush()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background flusher and send whatever is still pending."""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+
 
 class PrintInterceptor(io.TextIOBase):
     """Captures writes to stdout and forwards them to both the original
-    stdout and one or more EventBuses as log events."""
+    stdout and an EventBus as log events.
 
-    def __init__(self, original_stdout, event_buses: List[EventBus]):
+    With a ``batcher`` the lines are queued on it instead of being emitted
+    one event per write; flush() sends them, so code that emits a "log"
+    event directly can flush stdout first to keep the log in order.
+    """
+
+    def __init__(self, original_stdout, event_bus: EventBus,
+                 batcher: Optional[_LogBatcher] = None):
         self._original = original_stdout
-        self._event_buses = event_buses
+        self._event_bus = event_bus
+        self._batcher = batcher
+        # Whether anything was written since the last flush
+        self._dirty = False
+
+    def _has_log_listeners(self) -> bool:
+        """Whether the bus has a "log" or "log_batch" subscriber."""
+        count = self._event_bus.subscriber_count
+        return bool(count("log") or count("log_batch"))
 
     def write(self, text: str) -> int:
-        if text and text.strip():
-            for bus in self._event_buses:
-                try:
-                    bus.emit("log", text.strip())
-                except Exception:
-                    pass
+        # print() writes the trailing newline separately; skip such
+        # whitespace-only writes before paying for a strip()
+        if text and not text.isspace() and self._has_log_listeners():
+            stripped = text.strip()
+            if self._batcher is not None:
+                self._batcher.add(stripped)
+            else:
+                self._event_bus.emit("log", stripped)
         self._original.write(text)
+        self._dirty = True
         return len(text)
 
     def flush(self):
-        self._original.flush()
+        if self._batcher is not None:
+            self._batcher.flush()
+        # print(flush=True) and friends flush after every call; skip the
+        # underlying (possibly syscall-backed) flush when nothing is pending
+        if self._dirty:
+            self._dirty = False
+            self._original.flush()
 
     def fileno(self):
         return self._original.fileno()
 
 
+class _ThreadRoutedStdout(io.TextIOBase):
+    """sys.stdout replacement that routes writes by the writing thread.
+
+    Each game thread registers its PrintInterceptor; writes from any other
+    thread go straight to the real stdout. This keeps concurrent sessions
+    from capturing each other's (or the UI thread's) output. Only the game
+    thread itself is captured: threads it spawns (such as the round-end
+    confirmation waits in Game) print to the real stdout.
+
+    Stream attributes (encoding, isatty(), buffer, ...) are those of the
+    real stdout, so code inspecting sys.stdout sees the actual terminal.
+    """
+
+    def __init__(self, real_stdout):
+        self.real = real_stdout
+        self._routes: Dict[int, PrintInterceptor] = {}
+
+    def register(self, interceptor: PrintInterceptor) -> None:
+        """Route the calling thread's writes to ``interceptor``."""
+        self._routes[threading.get_ident()] = interceptor
+
+    def unregister(self) -> None:
+        self._routes.pop(threading.get_ident(), None)
+
+    def write(self, text: str) -> int:
+        return self._routes.get(threading.get_ident(), self.real).write(text)
+
+    def flush(self):
+        self._routes.get(threading.get_ident(), self.real).flush()
+
+    def fileno(self):
+        return self.real.fileno()
+
+    def isatty(self) -> bool:
+        return self.real.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+    @property
+    def encoding(self):
+        return self.real.encoding
+
+    @property
+    def errors(self):
+        return self.real.errors
+
+    def __getattr__(self, name):
+        # Only reached for attributes TextIOBase doesn't define
+        return getattr(self.real, name)
+
+
+_stdout_router: Optional[_ThreadRoutedStdout] = None
+_stdout_router_lock = threading.Lock()
+
+
+def _get_stdout_router() -> _ThreadRoutedStdout:
+    """Install the routed stdout on first use and return it."""
+    global _stdout_router
+    with _stdout_router_lock:
+        if _stdout_router is None:
+            _stdout_router = _ThreadRoutedStdout(sys.stdout)
+            sys.stdout = _stdout_router
+        return _stdout_router
+
+
 class GameSession:
     """Manages a single game session for the web UI."""
 
@@ -53,10 +256,10 @@ class GameSession:
         self.ai_count = ai_count
         self.web_player: Optional[WebPlayer] = None
         self.game: Optional[Game] = None
-        self._thread: Optional[threading.Thread] = None
-        self._finished = False
+        self._done = threading.Event()
         self._all_event_buses: List[EventBus] = [event_bus]
         self._room = None
+        self._log_bus = MultiplexBus(self._all_event_buses)
 
     def start(self) -> WebPlayer:
         """Create players and start the game in a background thread."""
@@ -72,17 +275,14 @@ class GameSession:
 
         # Reset counters for fresh game
         Card.reset_id_counter()
-        from src.player import Player
         Player.reset_id_counter()
-        from src.round import Round
         Round.reset_id_counter()
 
         # Create game with pre-built players
         self.game = Game(players=players)
 
-        # Start game in a daemon thread
-        self._thread = threading.Thread(target=self._run_game, daemon=True)
-        self._thread.start()
+        # Run the game on a pooled daemon thread
+        _GAME_RUNNERS.submit(self._run_game)
 
         return self.web_player
 
@@ -99,8 +299,7 @@ class GameSession:
         session.ai_count = room.ai_count
         session.web_player = None
         session.game = None
-        session._thread = None
-        session._finished = False
+        session._done = threading.Event()
         session._room = room
 
         players = []
@@ -116,6 +315,8 @@ class GameSession:
             all_event_buses.append(info["event_bus"])
 
         session._all_event_buses = all_event_buses
+        # Every player sees the same log stream, so the capture emits once
+        session._log_bus = MultiplexBus(all_event_buses)
 
         # Create AI players with animation support
         for i in range(room.ai_count):
@@ -126,45 +327,54 @@ class GameSession:
 
         # Reset counters for fresh game
         Card.reset_id_counter()
-        from src.player import Player
         Player.reset_id_counter()
-        from src.round import Round
         Round.reset_id_counter()
 
         # Create game with pre-built players
         session.game = Game(players=players)
 
-        # Start game in a daemon thread
-        session._thread = threading.Thread(
-            target=session._run_game, daemon=True
-        )
-        session._thread.start()
+        # Run the game on a pooled daemon thread
+        _GAME_RUNNERS.submit(session._run_game)
 
         return session
 
     def _run_game(self) -> None:
-        """Run the game loop, capturing stdout."""
-        original_stdout = sys.stdout
-        interceptor = PrintInterceptor(original_stdout, self._all_event_buses)
-        sys.stdout = interceptor
+        """Run the game loop, capturing this thread's stdout."""
+        router = _get_stdout_router()
+        log_bus = self._log_bus
+        batcher = _LogBatcher(log_bus)
+        batcher.start()
+        interceptor = PrintInterceptor(router.real, log_bus, batcher)
+        router.register(interceptor)
         try:
             self.game.play_game()
         except Exception as e:
-            for bus in self._all_event_buses:
-                try:
-                    bus.emit("log", f"Game error: {e}")
-                    bus.emit("game_error", str(e))
-                except Exception:
-                    pass
+            batcher.flush()
+            log_bus.emit("log", f"Game error: {e}")
+            log_bus.emit("game_error", str(e))
         finally:
-            sys.stdout = original_stdout
-            self._finished = True
+            router.unregister()
+            # Flush pending log lines before the game_over below
+            batcher.stop()
+            self._done.set()
             if self._room:
-                self._room.state = "finished"
+                self._room.mark_finished()
                 self._room.broadcast_game_over(None)
             else:
                 self.event_bus.emit("game_over", None)
 
+    def rebind_event_buses(self, event_buses) -> None:
+        """Route game output to a new set of buses (after a reconnect).
+
+        The bus list is updated in place because the AI players share it.
+        """
+        self._all_event_buses[:] = event_buses
+        self._log_bus.set_children(self._all_event_buses)
+
     @property
     def is_finished(self) -> bool:
-        return self._finished
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the game thread finishes; False if ``timeout`` expires."""
+        return self._done.wait(timeout)
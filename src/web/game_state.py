@@ -2,13 +2,16 @@
 Serializable snapshot of the game state for the UI.
 
 The game thread builds a GameStateSnapshot from live game objects.
-The UI reads it to render cards, scores, and other info.
+The UI reads it to render cards, scores, and other info. Snapshots are
+read-only once emitted, so their collection fields are tuples / mappings
+and the value types they hold are frozen. GameStateSnapshot itself stays
+mutable because the producer fills it in steps before emitting it.
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Mapping, Optional, Dict, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CardView:
     """How a single card appears to the viewing player."""
     position: int
@@ -17,27 +20,27 @@ class CardView:
     is_publicly_visible: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlayerView:
     """How a player's hand appears to the viewing player."""
     name: str
     character: str  # "WEB", "COMPUTER", etc.
     is_current_player: bool  # is this the viewing player?
-    cards: List[CardView] = field(default_factory=list)
+    cards: Tuple[CardView, ...] = ()
     game_score: int = 0
     called_kabo: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InputRequest:
     """Describes what input the UI should collect from the player."""
     request_type: str  # "pick_turn_type", "decide_on_card_use", etc.
     prompt: str
-    options: List[str] = field(default_factory=list)
+    options: Tuple[str, ...] = ()
     extra: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TurnNotification:
     """A notification shown to players about game events."""
     message: str
@@ -47,18 +50,18 @@ class TurnNotification:
     extra: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoundSummary:
     """Summary of a completed round for the end-of-round screen."""
     round_number: int
-    player_hands: List[PlayerView]  # all cards revealed
+    player_hands: Tuple[PlayerView, ...]  # all cards revealed
     round_scores: Dict[str, int]  # player_name -> round score
     game_scores: Dict[str, int]  # player_name -> updated total
     kabo_caller: str = ""
     kabo_successful: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationEvent:
     """Describes a visual animation that should play on all clients."""
     animation_type: str  # "draw_deck", "draw_discard", "exchange", "discard",
@@ -73,7 +76,7 @@ class AnimationEvent:
     duration_ms: int = 800
 
 
-@dataclass
+@dataclass(slots=True)
 class GameStateSnapshot:
     """Complete snapshot of the game state as seen by a specific player."""
     phase: str  # "setup", "peek", "playing", "round_over", "game_over"
@@ -81,10 +84,27 @@ class GameStateSnapshot:
     current_player_name: str = ""
     discard_top_value: Optional[int] = None
     deck_cards_left: int = 0
-    players: List[PlayerView] = field(default_factory=list)
+    players: Tuple[PlayerView, ...] = ()
     input_request: Optional[InputRequest] = None
-    scores: Dict[str, int] = field(default_factory=dict)
+    scores: Mapping[str, int] = field(default_factory=dict)
     kabo_called: bool = False
     kabo_caller: str = ""
     active_turn_player_name: str = ""
     round_summary: Optional[RoundSummary] = None
+
+    def view_key(self) -> tuple:
+        """Hashable summary of the table state this snapshot shows.
+
+        Two snapshots with equal keys render the same table; the input
+        request is deliberately left out.
+        """
+        return (
+            self.phase, self.round_number, self.deck_cards_left,
+            self.discard_top_value, self.active_turn_player_name,
+            self.kabo_called, self.kabo_caller,
+            tuple(
+                (p.name, p.called_kabo, p.game_score,
+                 tuple((c.position, c.value, c.is_known) for c in p.cards))
+                for p in self.players
+            ),
+        )
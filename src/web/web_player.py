@@ -2,11 +2,15 @@
 WebPlayer - bridges the synchronous game thread with the async NiceGUI UI.
 
 Each decision method emits a state snapshot + input request via EventBus,
-then blocks on a queue.Queue until the UI submits the player's response.
+then blocks on a threading.Event until the UI submits the player's response.
 
 In multiplayer, also broadcasts state to other players via the GameRoom.
 """
-import queue
+import dataclasses
+import functools
+import sys
+import threading
+from types import MappingProxyType
 from typing import List, Optional, Type, Tuple, TypeVar
 
 from src.player import Player
@@ -20,31 +24,131 @@ from src.web.game_state import (
 
 P = TypeVar("P", bound=Player)
 
+# Prebuilt option tuples for the decision prompts
+_TURN_OPTIONS = {
+    # (discard pile non-empty, kabo still available) -> options
+    (True, True): ("HIT_DECK", "HIT_DISCARD_PILE", "KABO"),
+    (True, False): ("HIT_DECK", "HIT_DISCARD_PILE"),
+    (False, True): ("HIT_DECK", "KABO"),
+    (False, False): ("HIT_DECK",),
+}
+_CARD_USE_OPTIONS = ("KEEP", "DISCARD")
+_CARD_USE_OPTIONS_EFFECT = ("KEEP", "DISCARD", "EFFECT")
+_POSITION_OPTIONS = tuple(str(i) for i in range(16))
+_OK_OPTIONS = ("OK",)
+
+# (action_type, description template) broadcast for each decision; only
+# the chosen entry is formatted
+_TURN_ACTIONS = {
+    "HIT_DECK": ("draw_deck", "{name} draws from deck"),
+    "HIT_DISCARD_PILE": ("draw_discard", "{name} takes from discard pile"),
+    "KABO": ("kabo", "{name} calls KABO!"),
+}
+_CARD_USE_ACTIONS = {
+    "KEEP": ("keep", "{name} keeps the drawn card"),
+    "DISCARD": ("discard", "{name} discards the drawn card"),
+    "EFFECT": ("effect", "{name} uses card effect: {effect}"),
+}
+_UNKNOWN_ACTION = ("unknown", "{name} acts")
+
+
+def _position_options(hand_size: int) -> Tuple[str, ...]:
+    """Options "0".."hand_size-1" for a hand-position prompt."""
+    if hand_size <= len(_POSITION_OPTIONS):
+        return _POSITION_OPTIONS[:hand_size]
+    return tuple(str(i) for i in range(hand_size))
+
+
+@functools.lru_cache(maxsize=512)
+def _card_view(position: int, value: Optional[int], is_known: bool,
+               is_publicly_visible: bool) -> CardView:
+    """Shared CardView for one card state.
+
+    Snapshots never mutate their card views, so identical cards (most of a
+    table is face-down) reuse one instance across players and snapshots.
+    """
+    return CardView(position=position, value=value, is_known=is_known,
+                    is_publicly_visible=is_publicly_visible)
+
+
+def _hand_views(hand: List[Optional[Card]]) -> Tuple[CardView, ...]:
+    """Card views for a hand.
+
+    Only faceup (publicly_visible) cards are shown in the hand display;
+    all other card values are hidden to preserve the memory challenge.
+    """
+    card_view = _card_view
+    return tuple([
+        card_view(i, c.value if (visible := c.publicly_visible) else None,
+                  visible, visible)
+        for i, c in enumerate(hand) if c is not None
+    ])
+
+
+def _table_fingerprint(_round: Round) -> tuple:
+    """Cheap key covering everything build_shared_context() reads.
+
+    Card values never change, so a card is identified by its id() (it stays
+    alive while in a hand) plus its face-up flag.
+    """
+    return (
+        _round,
+        len(_round.discard_pile.cards),
+        _round.discard_pile[-1].value if _round.discard_pile else None,
+        len(_round.main_deck.cards),
+        _round.kabo_called,
+        tuple(
+            (p.players_game_score, p.called_kabo,
+             tuple(None if c is None else (id(c), c.publicly_visible)
+                   for c in p.hand))
+            for p in _round.players
+        ),
+    )
+
 
 class WebPlayer(Player):
-    """Player subclass that gets input from a browser UI via queue-based blocking."""
+    """Player subclass that gets input from a browser UI via event-based blocking."""
 
     def __init__(self, name: str):
         super().__init__(name, character="WEB")
-        self._response_queue: queue.Queue = queue.Queue()
+        # One-slot handoff from the UI thread; the UI answers each request
+        # at most once, so a full queue is not needed
+        self._response_event = threading.Event()
+        self._response_value = None
         self.event_bus: Optional[EventBus] = None
         self._current_round: Optional[Round] = None
         self._room = None  # GameRoom reference for multiplayer
+        # Whether logs may reveal card values: always in solo mode, in a
+        # room only when it was created with show_revelations
+        self._show_values = True
         self._last_new_card_position: Optional[int] = None
+        # Hand slot of the card last picked to peek/spy at, so the reveal
+        # does not have to search the hand for it
+        self._last_picked_position: Optional[int] = None
+        # Bumped whenever this player's own UI is sent a state (or gets a
+        # new bus); GameRoom uses it to tell when a 'waiting' snapshot has
+        # to be re-sent even though the table itself did not change
+        self.state_version = 0
+        # (table fingerprint, build_shared_context() result) of the last build
+        self._shared_cache: Optional[Tuple[tuple, dict]] = None
 
     def __hash__(self):
         return self.player_id
 
     def set_event_bus(self, bus: EventBus) -> None:
         self.event_bus = bus
+        self.state_version += 1
 
     def set_room(self, room) -> None:
         """Set the GameRoom for multiplayer broadcasting."""
         self._room = room
+        # show_revelations is fixed when the room is created
+        self._show_values = not room or getattr(room, "show_revelations", False)
 
     def submit_response(self, response) -> None:
         """Called from the UI thread to unblock the game thread."""
-        self._response_queue.put(response)
+        self._response_value = response
+        self._response_event.set()
 
     def _wait_for_response(self):
         """Block the game thread until the UI submits a response.
@@ -52,69 +156,101 @@ class WebPlayer(Player):
         Blocks indefinitely — regular game actions should not time out.
         Only round-end confirmation uses a separate timeout.
         """
-        return self._response_queue.get()
+        self._response_event.wait()
+        self._response_event.clear()
+        return self._response_value
+
+    @staticmethod
+    def build_shared_context(_round: Round) -> dict:
+        """Compute the viewer-independent part of a round snapshot.
+
+        Card visibility does not depend on who is looking (see
+        _hand_views), so the player views, pile info and scores can be
+        built once per broadcast and shared by every player's snapshot.
+        Each view is built as seen by an opponent; a viewer only copies
+        its own entry to set is_current_player.
+        """
+        views = []
+        scores = {}
+        kabo_caller = ""
+        for p in _round.players:
+            name = p.name
+            score = p.players_game_score
+            called_kabo = p.called_kabo
+            scores[name] = score
+            if called_kabo and not kabo_caller:
+                kabo_caller = name
+            views.append((p, PlayerView(
+                name=name,
+                character=p.character,
+                is_current_player=False,
+                cards=_hand_views(p.hand),
+                game_score=score,
+                called_kabo=called_kabo,
+            )))
+
+        return {
+            "views": tuple(views),
+            "discard_top": _round.discard_pile[-1].value if _round.discard_pile else None,
+            "deck_left": len(_round.main_deck.cards),
+            "round_number": _round.round_id,
+            "kabo_called": _round.kabo_called,
+            "kabo_caller": kabo_caller,
+            "scores": MappingProxyType(scores),
+        }
+
+    def shared_context(self, _round: Round) -> dict:
+        """build_shared_context() for ``_round``, reused while the table is
+        unchanged (decisions within one turn mostly see the same table)."""
+        key = _table_fingerprint(_round)
+        cached = self._shared_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        shared = self.build_shared_context(_round)
+        self._shared_cache = (key, shared)
+        return shared
 
     def _build_state_snapshot(self, _round: Optional[Round] = None,
-                              phase: str = "playing") -> GameStateSnapshot:
-        """Build a GameStateSnapshot from the perspective of this player."""
-        players = []
+                              phase: str = "playing",
+                              shared: Optional[dict] = None,
+                              input_request: Optional[InputRequest] = None,
+                              ) -> GameStateSnapshot:
+        """Build a GameStateSnapshot from the perspective of this player.
+
+        ``shared`` is an optional build_shared_context() result for the same
+        round, reused when snapshotting for several players at once.
+        ``input_request`` is attached to the snapshot as it is constructed.
+        """
         if _round:
-            for p in _round.players:
-                cards = []
-                for i, card in enumerate(p.hand):
-                    if card is None:
-                        continue
-                    visible = self._can_see_card(card, p)
-                    cards.append(CardView(
-                        position=i,
-                        value=card.value if visible else None,
-                        is_known=visible,
-                        is_publicly_visible=card.publicly_visible,
-                    ))
-                players.append(PlayerView(
-                    name=p.name,
-                    character=p.character,
-                    is_current_player=(p == self),
-                    cards=cards,
-                    game_score=p.players_game_score,
-                    called_kabo=p.called_kabo,
-                ))
-
-            discard_top = _round.discard_pile[-1].value if _round.discard_pile else None
-            deck_left = len(_round.main_deck.cards)
-            round_number = _round.round_id
-            kabo_called = _round.kabo_called
-            kabo_caller = ""
-            for p in _round.players:
-                if p.called_kabo:
-                    kabo_caller = p.name
-                    break
+            if shared is None:
+                shared = self.shared_context(_round)
+            players = tuple(
+                dataclasses.replace(view, is_current_player=True)
+                if p is self else view
+                for p, view in shared["views"]
+            )
+            discard_top = shared["discard_top"]
+            deck_left = shared["deck_left"]
+            round_number = shared["round_number"]
+            kabo_called = shared["kabo_called"]
+            kabo_caller = shared["kabo_caller"]
+            scores = shared["scores"]
         else:
             # No round context - build minimal state from self.hand
-            cards = []
-            for i, card in enumerate(self.hand):
-                if card is None:
-                    continue
-                visible = card.publicly_visible
-                cards.append(CardView(
-                    position=i,
-                    value=card.value if visible else None,
-                    is_known=visible,
-                    is_publicly_visible=card.publicly_visible,
-                ))
-            players = [PlayerView(
+            players = (PlayerView(
                 name=self.name,
                 character=self.character,
                 is_current_player=True,
-                cards=cards,
+                cards=_hand_views(self.hand),
                 game_score=self.players_game_score,
                 called_kabo=self.called_kabo,
-            )]
+            ),)
             discard_top = None
             deck_left = 0
             round_number = 0
             kabo_called = False
             kabo_caller = ""
+            scores = MappingProxyType({self.name: self.players_game_score})
 
         return GameStateSnapshot(
             phase=phase,
@@ -123,34 +259,51 @@ class WebPlayer(Player):
             discard_top_value=discard_top,
             deck_cards_left=deck_left,
             players=players,
+            input_request=input_request,
             kabo_called=kabo_called,
             kabo_caller=kabo_caller,
-            scores={p.name: p.game_score for p in players},
+            scores=scores,
             active_turn_player_name=self.name,
         )
 
-    def _can_see_card(self, card: Card, owner: Player) -> bool:
-        """Only faceup (publicly_visible) cards are shown in the hand display.
-        All other card values are hidden to preserve the memory challenge."""
-        return card.publicly_visible
-
-    def _emit_input_request(self, state: GameStateSnapshot) -> None:
+    def _emit_input_request(self, request: InputRequest, _round: Optional[Round],
+                            phase: str = "playing") -> None:
         """Emit game state update with input request to UI.
 
+        The snapshot of ``_round`` is only built when a bus is attached.
         In multiplayer, also broadcasts a 'waiting' state to other players.
         """
+        self.state_version += 1
+        # Drop a stale response (e.g. a round-end OK after its timeout)
+        self._response_event.clear()
         if self.event_bus:
-            self.event_bus.emit("state_update", state)
-            self.event_bus.emit("input_request", state.input_request)
+            state = self._build_state_snapshot(_round, phase=phase,
+                                               input_request=request)
+            self.event_bus.emit("turn_update", state)
 
-        # Broadcast to other players in the room
+        # Broadcast to other players in the room, reusing the shared
+        # context the request's own snapshot was built from
         if self._room and self._current_round:
             self._room.broadcast_state_to_others(
-                self.name, self._current_round
+                self.name, self._current_round,
+                shared=self.shared_context(self._current_round),
             )
 
     # --- Notification broadcasting ---
 
+    def _wants_log(self) -> bool:
+        """Whether this player's UI listens for log lines."""
+        return self.event_bus is not None and self.event_bus.subscriber_count("log") > 0
+
+    def _emit_log(self, message: str) -> None:
+        """Emit a log line to this player only.
+
+        Printed game output may still be batched on the game thread, so it
+        is flushed first to keep this line after it in the log.
+        """
+        sys.stdout.flush()
+        self.event_bus.emit("log", message)
+
     def _emit_self_animation(self, event: AnimationEvent) -> None:
         """Emit an animation event to this player's own event bus."""
         if self.event_bus:
@@ -159,25 +312,38 @@ class WebPlayer(Player):
             except Exception:
                 pass
 
-    def _broadcast_animation(self, event: AnimationEvent) -> None:
-        """Broadcast an animation event to all other players."""
-        if not self._room:
-            return
-        with self._room._lock:
-            others = {name: info for name, info in self._room.players.items()
-                      if name != self.name}
-        for name, info in others.items():
-            bus = info.get("event_bus")
-            if bus:
+    def _has_others(self) -> bool:
+        """Whether another room player has a bus to broadcast to.
+
+        Lets callers skip building notifications nobody will receive.
+        """
+        room = self._room
+        if room is None:
+            return False
+        buses = room._named_buses
+        return len(buses) > 1 or (len(buses) == 1 and buses[0][0] != self.name)
+
+    def _emit_to_others(self, event_type: str, data) -> None:
+        """Emit an event on every other room player's bus.
+
+        Reads the room's copy-on-write bus snapshot, so no lock is taken.
+        """
+        for name, bus in self._room._named_buses:
+            if name != self.name:
                 try:
-                    bus.emit("animation", event)
+                    bus.emit(event_type, data)
                 except Exception:
                     pass
 
+    def _broadcast_animation(self, event: AnimationEvent) -> None:
+        """Broadcast an animation event to all other players."""
+        if self._has_others():
+            self._emit_to_others("animation", event)
+
     def _broadcast_action(self, action_type: str, description: str,
                           extra: dict = None) -> None:
         """Broadcast an action notification to all other players."""
-        if not self._room:
+        if not self._has_others():
             return
         notification = TurnNotification(
             message=description,
@@ -186,66 +352,43 @@ class WebPlayer(Player):
             player_name=self.name,
             extra=extra or {},
         )
-        with self._room._lock:
-            others = {name: info for name, info in self._room.players.items()
-                      if name != self.name}
-        for name, info in others.items():
-            bus = info.get("event_bus")
-            if bus:
-                try:
-                    bus.emit("notification", notification)
-                except Exception:
-                    pass
+        self._emit_to_others("notification", notification)
 
     # --- Round lifecycle ---
 
     def notify_round_start(self, _round: Round) -> None:
         """Broadcast initial table state to this player at round start."""
         self._current_round = _round
-        state = self._build_state_snapshot(_round)
-        state.input_request = InputRequest(
-            request_type="waiting",
-            prompt="Round starting... waiting for players to peek at cards.",
-            options=[],
-        )
+        self.state_version += 1
         if self.event_bus:
-            self.event_bus.emit("state_update", state)
-            self.event_bus.emit("input_request", state.input_request)
+            state = self._build_state_snapshot(_round, input_request=InputRequest(
+                request_type="waiting",
+                prompt="Round starting... waiting for players to peek at cards.",
+                options=(),
+            ))
+            self.event_bus.emit("turn_update", state)
 
     # --- Overrides for state emission and log masking ---
 
+    def log_exchange(self, message: str) -> None:
+        """Drop the base class's value-revealing exchange messages when
+        the log toggle is off; the overrides below print masked ones."""
+        if self._show_values:
+            print(message)
+
     def perform_card_exchange(self, cards_selected_for_exchange: List[Card],
                               drawn_card: Card, _round: Round) -> None:
         """Override to mask card values in print when log toggle is off."""
-        show_values = not self._room or getattr(self._room, "show_revelations", False)
-        if show_values:
-            super().perform_card_exchange(cards_selected_for_exchange, drawn_card, _round)
-        else:
-            # Call super but suppress its print by temporarily redirecting
-            import io, sys
-            old_stdout = sys.stdout
-            sys.stdout = io.StringIO()
-            try:
-                super().perform_card_exchange(cards_selected_for_exchange, drawn_card, _round)
-            finally:
-                sys.stdout = old_stdout
+        super().perform_card_exchange(cards_selected_for_exchange, drawn_card, _round)
+        if not self._show_values:
             count = len(cards_selected_for_exchange)
             print(f"  {self.name} exchanged {count} card(s) for a new card.")
 
     def failed_multi_exchange(self, drawn_card: Card,
                               attempted_cards: List[Card], _round: Round) -> None:
         """Override to mask card values in print when log toggle is off."""
-        show_values = not self._room or getattr(self._room, "show_revelations", False)
-        if show_values:
-            super().failed_multi_exchange(drawn_card, attempted_cards, _round)
-        else:
-            import io, sys
-            old_stdout = sys.stdout
-            sys.stdout = io.StringIO()
-            try:
-                super().failed_multi_exchange(drawn_card, attempted_cards, _round)
-            finally:
-                sys.stdout = old_stdout
+        super().failed_multi_exchange(drawn_card, attempted_cards, _round)
+        if not self._show_values:
             count = len(attempted_cards)
             print(f"  Exchange FAILED! {self.name} attempted {count} cards but they don't match.")
 
@@ -257,10 +400,11 @@ class WebPlayer(Player):
             animation_type="exchange", player_name=self.name, duration_ms=1500)
         self._emit_self_animation(anim)
         self._broadcast_animation(anim)
-        # Emit updated state so UI reflects changes (extra cards, face-up cards)
+        # Emit updated state so UI reflects changes (extra cards, face-up cards).
+        # The table changed, so build the shared context once for everyone
+        shared = self.shared_context(_round)
         if self._room:
-            self._room.broadcast_state_to_others(self.name, _round)
-        state = self._build_state_snapshot(_round)
+            self._room.broadcast_state_to_others(self.name, _round, shared=shared)
 
         extra = {}
         if self._last_new_card_position is not None:
@@ -272,39 +416,30 @@ class WebPlayer(Player):
                 pass
             self._last_new_card_position = None
 
-        state.input_request = InputRequest(
-            request_type="waiting", prompt="Exchange complete.", options=[],
-            extra=extra)
+        self.state_version += 1
         if self.event_bus:
+            state = self._build_state_snapshot(
+                _round, shared=shared,
+                input_request=InputRequest(
+                    request_type="waiting", prompt="Exchange complete.",
+                    options=(), extra=extra))
             self.event_bus.emit("state_update", state)
 
     # --- Decision methods ---
 
     def pick_turn_type(self, _round: Round = None) -> str:
         self._current_round = _round
-        state = self._build_state_snapshot(_round)
-        options = ["HIT_DECK"]
-        if _round.discard_pile:
-            options.append("HIT_DISCARD_PILE")
-        if not _round.kabo_called:
-            options.append("KABO")
-        state.input_request = InputRequest(
+        discard_top = _round.discard_pile[-1].value if _round.discard_pile else None
+        request = InputRequest(
             request_type="pick_turn_type",
-            prompt=f"Your turn! Discard pile top: {state.discard_top_value}. Choose your action:",
-            options=options,
+            prompt=f"Your turn! Discard pile top: {discard_top}. Choose your action:",
+            options=_TURN_OPTIONS[bool(_round.discard_pile), not _round.kabo_called],
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, _round)
         response = self._wait_for_response()
         if response is None:
             response = "HIT_DECK"  # safe default on timeout
         print(f"  {self.name} chose: {response}")
-        # Broadcast action to other players
-        action_map = {
-            "HIT_DECK": ("draw_deck", f"{self.name} draws from deck"),
-            "HIT_DISCARD_PILE": ("draw_discard", f"{self.name} takes from discard pile"),
-            "KABO": ("kabo", f"{self.name} calls KABO!"),
-        }
-        action_type, desc = action_map.get(response, ("unknown", f"{self.name} acts"))
 
         # Emit animation to self and broadcast to other players
         if response == "KABO":
@@ -327,49 +462,37 @@ class WebPlayer(Player):
             self._emit_self_animation(anim)
             self._broadcast_animation(anim)
 
-        notification_type = "kabo_called" if response == "KABO" else "opponent_action"
-        if self._room:
+        if self._has_others():
+            # Broadcast action to other players
+            notification_type = ("kabo_called" if response == "KABO"
+                                 else "opponent_action")
+            action_type, template = _TURN_ACTIONS.get(response, _UNKNOWN_ACTION)
             notification = TurnNotification(
-                message=desc, notification_type=notification_type,
+                message=template.format(name=self.name),
+                notification_type=notification_type,
                 action_type=action_type, player_name=self.name,
             )
-            with self._room._lock:
-                others = {n: info for n, info in self._room.players.items()
-                          if n != self.name}
-            for n, info in others.items():
-                bus = info.get("event_bus")
-                if bus:
-                    try:
-                        bus.emit("notification", notification)
-                    except Exception:
-                        pass
+            self._emit_to_others("notification", notification)
         return response
 
     def decide_on_card_use(self, card: Card) -> str:
-        state = self._build_state_snapshot(self._current_round)
-        options = ["KEEP", "DISCARD"]
-        if card.effect:
-            options.append("EFFECT")
-        state.input_request = InputRequest(
+        request = InputRequest(
             request_type="decide_on_card_use",
             prompt=f"You drew card {card.value}"
                    + (f" ({card.effect})" if card.effect else "")
                    + ". What do you want to do?",
-            options=options,
+            options=_CARD_USE_OPTIONS_EFFECT if card.effect else _CARD_USE_OPTIONS,
             extra={"drawn_card_value": card.value, "drawn_card_effect": card.effect},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, self._current_round)
         response = self._wait_for_response()
         if response is None:
             response = "DISCARD"
         # Broadcast decision to other players
-        decision_map = {
-            "KEEP": ("keep", f"{self.name} keeps the drawn card"),
-            "DISCARD": ("discard", f"{self.name} discards the drawn card"),
-            "EFFECT": ("effect", f"{self.name} uses card effect: {card.effect}"),
-        }
-        action_type, desc = decision_map.get(response, ("unknown", f"{self.name} acts"))
-        self._broadcast_action(action_type, desc)
+        if self._has_others():
+            action_type, template = _CARD_USE_ACTIONS.get(response, _UNKNOWN_ACTION)
+            self._broadcast_action(
+                action_type, template.format(name=self.name, effect=card.effect))
 
         # Emit animation to self and broadcast for discard/effect
         if response in ("DISCARD", "EFFECT"):
@@ -382,19 +505,13 @@ class WebPlayer(Player):
         return response
 
     def pick_hand_cards_for_exchange(self, drawn_card: Card) -> List[Card]:
-        state = self._build_state_snapshot(self._current_round)
-        hand_info = []
-        for i, c in enumerate(self.hand):
-            visible = c.publicly_visible
-            hand_info.append({"pos": i, "value": c.value if visible else None})
-
-        state.input_request = InputRequest(
+        request = InputRequest(
             request_type="pick_hand_cards_for_exchange",
             prompt=f"You're keeping card {drawn_card.value}. Select card(s) in your hand to discard:",
-            options=[str(i) for i in range(len(self.hand))],
-            extra={"drawn_card_value": drawn_card.value, "hand_info": hand_info},
+            options=_position_options(len(self.hand)),
+            extra={"drawn_card_value": drawn_card.value},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, self._current_round)
         response = self._wait_for_response()  # list of position ints
         if response is None:
             response = [0]
@@ -410,75 +527,57 @@ class WebPlayer(Player):
         return chosen
 
     def pick_cards_to_see(self, num_cards_to_see: int) -> List[int]:
-        state = self._build_state_snapshot(self._current_round, phase="peek")
-        state.input_request = InputRequest(
+        request = InputRequest(
             request_type="pick_cards_to_see",
             prompt=f"Choose {num_cards_to_see} card(s) to peek at:",
-            options=[str(i) for i in range(len(self.hand))],
+            options=_position_options(len(self.hand)),
             extra={"num_cards_to_see": num_cards_to_see},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, self._current_round, phase="peek")
         response = self._wait_for_response()  # list of ints
         if response is None:
-            return list(range(num_cards_to_see))
+            response = list(range(num_cards_to_see))
         if isinstance(response, int):
             response = [response]
+        self._last_picked_position = response[0] if response else None
         return response
 
     def specify_spying(self, _round: Round) -> Tuple[Type[P], Card]:
-        opponents = [p for p in _round.players if p != self]
-        opponent_info = []
-        for opp in opponents:
-            opponent_info.append({
-                "name": opp.name,
-                "hand_size": len(opp.hand),
-            })
-
-        state = self._build_state_snapshot(_round)
-        state.input_request = InputRequest(
+        # The table is picked from directly: the snapshot's player views
+        # already carry every opponent's name and hand
+        request = InputRequest(
             request_type="specify_spying",
             prompt="Click an opponent's card on the table to spy on it:",
-            extra={"opponents": opponent_info},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, _round)
         response = self._wait_for_response()  # {"opponent": name, "card_idx": int}
         if response is None:
-            opp = opponents[0]
+            opp = next(p for p in _round.players if p is not self)
+            self._last_picked_position = 0
             return opp, opp.hand[0]
         opponent = _round.get_player_by_name(response["opponent"])
         card = opponent.hand[response["card_idx"]]
+        self._last_picked_position = response["card_idx"]
         print(f"  {self.name} spies on {opponent.name}'s card at position {response['card_idx']}.")
-        self._broadcast_action(
-            "spy", f"{self.name} spied on {opponent.name}'s card at position {response['card_idx']}")
-        self._broadcast_animation(AnimationEvent(
-            animation_type="spy", player_name=self.name,
-            target_player_name=opponent.name,
-            target_positions=[response["card_idx"]], duration_ms=2500))
+        if self._has_others():
+            self._broadcast_action(
+                "spy", f"{self.name} spied on {opponent.name}'s card at position {response['card_idx']}")
+            self._broadcast_animation(AnimationEvent(
+                animation_type="spy", player_name=self.name,
+                target_player_name=opponent.name,
+                target_positions=[response["card_idx"]], duration_ms=2500))
         return opponent, card
 
     def specify_swap(self, _round: Round) -> Tuple[Type[P], int, int]:
-        opponents = [p for p in _round.players if p != self]
-        opponent_info = []
-        for opp in opponents:
-            opponent_info.append({
-                "name": opp.name,
-                "hand_size": len(opp.hand),
-            })
-        hand_info = []
-        for i, c in enumerate(self.hand):
-            visible = c.publicly_visible
-            hand_info.append({"pos": i, "value": c.value if visible else None})
-
-        state = self._build_state_snapshot(_round)
-        state.input_request = InputRequest(
+        # As in specify_spying, the cards are picked from the table views
+        request = InputRequest(
             request_type="specify_swap",
             prompt="Click your card first, then an opponent's card to swap:",
-            extra={"opponents": opponent_info, "hand_info": hand_info},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, _round)
         response = self._wait_for_response()
         if response is None:
-            opp = opponents[0]
+            opp = next(p for p in _round.players if p is not self)
             return opp, 0, 0
         # {"own_card_idx": int, "opponent": name, "opp_card_idx": int}
         opponent = _round.get_player_by_name(response["opponent"])
@@ -497,22 +596,22 @@ class WebPlayer(Player):
 
     def report_known_cards_on_hand(self) -> None:
         """Show known cards to the web player and wait for confirmation."""
-        known_cards = []
-        hand_display = []
-        for i, c in enumerate(self.hand):
-            if c.known_to_owner or c.publicly_visible:
-                hand_display.append(str(c.value))
-                known_cards.append({"position": i, "value": c.value})
-            else:
-                hand_display.append("?")
+        known_cards = [
+            {"position": i, "value": c.value}
+            for i, c in enumerate(self.hand)
+            if c.known_to_owner or c.publicly_visible
+        ]
+        hand_text = ", ".join(
+            str(c.value) if c.known_to_owner or c.publicly_visible else "?"
+            for c in self.hand
+        )
 
         # Log: show values only if toggle is on or solo mode (no room)
-        show_values = not self._room or getattr(self._room, "show_revelations", False)
-        if self.event_bus:
-            if show_values:
-                self.event_bus.emit("log", f"{self.name}'s hand: [{', '.join(hand_display)}]")
+        if self._wants_log():
+            if self._show_values:
+                self._emit_log(f"{self.name}'s hand: [{hand_text}]")
             else:
-                self.event_bus.emit("log", "Memorize your starting cards!")
+                self._emit_log("Memorize your starting cards!")
 
         # Build revealed_cards for in-place display on game table
         revealed_cards = [
@@ -521,17 +620,30 @@ class WebPlayer(Player):
         ]
 
         # Action panel always shows actual card values for the viewing player
-        state = self._build_state_snapshot(self._current_round)
-        state.input_request = InputRequest(
+        request = InputRequest(
             request_type="initial_peek_reveal",
-            prompt=f"Your cards: [{', '.join(hand_display)}]. Memorize them!",
-            options=["OK"],
-            extra={"known_cards": known_cards, "hand_display": hand_display,
-                   "revealed_cards": revealed_cards},
+            prompt=f"Your cards: [{hand_text}]. Memorize them!",
+            options=_OK_OPTIONS,
+            extra={"known_cards": known_cards, "revealed_cards": revealed_cards},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, self._current_round)
         self._wait_for_response()
 
+    def _picked_card_position(self, card: Card, hand: List[Card]) -> int:
+        """Position of the just-picked ``card`` in ``hand``, or -1.
+
+        Uses the slot recorded when the card was picked and only falls back
+        to searching the hand if that slot no longer holds the card.
+        """
+        pos = self._last_picked_position
+        self._last_picked_position = None
+        if pos is not None and 0 <= pos < len(hand) and hand[pos] is card:
+            return pos
+        try:
+            return hand.index(card)
+        except ValueError:
+            return -1
+
     def tell_player_card_value(self, card: Card, effect: str) -> None:
         """Show the peeked/spied card value and wait for player confirmation."""
         if effect == "PEAK":
@@ -542,82 +654,49 @@ class WebPlayer(Player):
             masked_msg = "You spied on a card"
 
         # Log: show value only if toggle is on or solo mode (no room)
-        show_values = not self._room or getattr(self._room, "show_revelations", False)
-        log_msg = full_msg if show_values else masked_msg
-        if self.event_bus:
-            self.event_bus.emit("log", log_msg)
+        if self._wants_log():
+            self._emit_log(full_msg if self._show_values else masked_msg)
 
-        # Build revealed card info for in-place display on game table
+        owner = self if effect == "PEAK" else card.owner
         revealed_cards = []
-        if effect == "PEAK":
-            try:
-                card_position = self.hand.index(card)
-            except ValueError:
-                card_position = -1
+        if owner:
+            card_position = self._picked_card_position(card, owner.hand)
+            # Build revealed card info for in-place display on game table
             revealed_cards.append({
-                "owner": self.name, "position": card_position, "value": card.value,
+                "owner": owner.name, "position": card_position, "value": card.value,
             })
-        else:  # SPY
-            owner = card.owner
-            if owner:
-                try:
-                    card_position = owner.hand.index(card)
-                except ValueError:
-                    card_position = -1
-                revealed_cards.append({
-                    "owner": owner.name, "position": card_position, "value": card.value,
-                })
-
-        # Emit self-animation for peek/spy before showing the reveal dialog
-        if effect == "PEAK":
-            try:
-                card_position = self.hand.index(card)
-            except ValueError:
-                card_position = 0
-            self._emit_self_animation(AnimationEvent(
-                animation_type="peek", player_name=self.name,
-                card_value=card.value, card_positions=[card_position],
-                duration_ms=2500))
-        else:  # SPY
-            owner = card.owner
-            if owner:
-                try:
-                    card_position = owner.hand.index(card)
-                except ValueError:
-                    card_position = 0
+            # Emit self-animation for peek/spy before showing the reveal dialog
+            anim_position = max(card_position, 0)
+            if effect == "PEAK":
+                self._emit_self_animation(AnimationEvent(
+                    animation_type="peek", player_name=self.name,
+                    card_value=card.value, card_positions=[anim_position],
+                    duration_ms=2500))
+            else:  # SPY
                 self._emit_self_animation(AnimationEvent(
                     animation_type="spy", player_name=self.name,
                     target_player_name=owner.name,
                     card_value=card.value,
-                    target_positions=[card_position], duration_ms=2500))
+                    target_positions=[anim_position], duration_ms=2500))
 
         # Action panel always shows the actual card value for the viewing player
-        state = self._build_state_snapshot(self._current_round)
-        state.input_request = InputRequest(
+        request = InputRequest(
             request_type="card_reveal",
             prompt=full_msg,
-            options=["OK"],
+            options=_OK_OPTIONS,
             extra={"value": card.value, "effect": effect,
                    "revealed_cards": revealed_cards},
         )
-        self._emit_input_request(state)
+        self._emit_input_request(request, self._current_round)
         self._wait_for_response()
 
     def wait_for_round_end_confirmation(self, round_summary: RoundSummary,
                                         _round: Round) -> None:
         """Show round-end summary and wait for player to confirm continuation."""
-        # Build state with all cards revealed
-        state = self._build_state_snapshot(_round, phase="round_over")
-        # Replace player views with fully revealed versions
-        state.players = round_summary.player_hands
-        # Mark the current player in the revealed views
-        for pv in state.players:
-            pv.is_current_player = (pv.name == self.name)
-        state.round_summary = round_summary
-        state.input_request = InputRequest(
+        request = InputRequest(
             request_type="round_end_confirm",
             prompt="Round complete! Review scores and continue.",
-            options=["OK"],
+            options=_OK_OPTIONS,
             extra={
                 "round_scores": round_summary.round_scores,
                 "game_scores": round_summary.game_scores,
@@ -625,11 +704,20 @@ class WebPlayer(Player):
                 "kabo_successful": round_summary.kabo_successful,
             },
         )
+        # Build state with all cards revealed
+        state = self._build_state_snapshot(_round, phase="round_over",
+                                           input_request=request)
+        # Replace player views with fully revealed versions, marking the
+        # current player on copies: the summary is shared by all players
+        state.players = tuple(
+            dataclasses.replace(pv, is_current_player=(pv.name == self.name))
+            for pv in round_summary.player_hands
+        )
+        state.round_summary = round_summary
+        self.state_version += 1
+        self._response_event.clear()
         if self.event_bus:
-            self.event_bus.emit("state_update", state)
-            self.event_bus.emit("input_request", state.input_request)
+            self.event_bus.emit("turn_update", state)
         # Block with timeout - auto-continue if player doesn't confirm
-        try:
-            self._response_queue.get(timeout=60)
-        except queue.Empty:
-            pass
+        if self._response_event.wait(timeout=60):
+            self._response_event.clear()
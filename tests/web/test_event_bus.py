@@ -0,0 +1,54 @@
+"""
+Tests for MultiplexBus in src/web/event_bus.py.
+"""
+from src.web.event_bus import EventBus, MultiplexBus
+
+
+def test_emit_reaches_every_child():
+    a, b = EventBus(), EventBus()
+    seen = []
+    a.subscribe("log", lambda m: seen.append(("a", m)))
+    b.subscribe("log", lambda m: seen.append(("b", m)))
+
+    MultiplexBus([a, b]).emit("log", "hello")
+
+    assert seen == [("a", "hello"), ("b", "hello")]
+
+
+def test_set_children_redirects_emits():
+    old, new = EventBus(), EventBus()
+    seen = []
+    old.subscribe("log", lambda m: seen.append(("old", m)))
+    new.subscribe("log", lambda m: seen.append(("new", m)))
+    bus = MultiplexBus([old])
+
+    bus.set_children([new])
+    bus.emit("log", "hello")
+
+    assert seen == [("new", "hello")]
+
+
+def test_subscribe_and_count_forward_to_current_children():
+    a, b = EventBus(), EventBus()
+    bus = MultiplexBus([a])
+    bus.set_children([a, b])
+
+    bus.subscribe("log", print)
+
+    assert a.subscriber_count("log") == 1
+    assert b.subscriber_count("log") == 1
+    assert bus.subscriber_count("log") == 2
+
+
+def test_failing_child_is_skipped():
+    class _Broken(EventBus):
+        def emit(self, event_type, data=None):
+            raise RuntimeError("broken child")
+
+    good = EventBus()
+    seen = []
+    good.subscribe("log", seen.append)
+
+    MultiplexBus([_Broken(), good]).emit("log", "hello")
+
+    assert seen == ["hello"]
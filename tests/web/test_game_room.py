@@ -0,0 +1,62 @@
+"""
+Tests for the 'waiting' snapshot dedupe in GameRoom.broadcast_state_to_others.
+"""
+import pytest
+
+from src.game import Game
+from src.web.event_bus import EventBus
+from src.web.game_room import GameRoom
+from src.web.web_player import WebPlayer
+
+
+@pytest.fixture
+def room_round():
+    room = GameRoom("TEST", "alice", max_players=2)
+    received = {}
+    players = []
+    for name in ("alice", "bob"):
+        bus = EventBus()
+        received[name.upper()] = seen = []
+        bus.subscribe("turn_update", seen.append)
+        room.add_player(name, bus)
+        wp = WebPlayer(name)
+        wp.set_event_bus(bus)
+        wp.set_room(room)
+        room.players[name.upper()]["web_player"] = wp
+        players.append(wp)
+    _round = Game(players=players)._init_round()
+    return room, _round, received
+
+
+def test_unchanged_table_is_sent_once(room_round):
+    room, _round, received = room_round
+
+    room.broadcast_state_to_others("ALICE", _round)
+    room.broadcast_state_to_others("ALICE", _round)
+
+    assert received["ALICE"] == []
+    assert len(received["BOB"]) == 1
+    state = received["BOB"][0]
+    assert state.input_request.request_type == "waiting"
+    assert state.active_turn_player_name == "ALICE"
+
+
+def test_bumped_state_version_is_resent(room_round):
+    room, _round, received = room_round
+    bob = room.players["BOB"]["web_player"]
+
+    room.broadcast_state_to_others("ALICE", _round)
+    bob.state_version += 1
+    room.broadcast_state_to_others("ALICE", _round)
+
+    assert len(received["BOB"]) == 2
+
+
+def test_changed_table_is_resent(room_round):
+    room, _round, received = room_round
+
+    room.broadcast_state_to_others("ALICE", _round)
+    _round.discard_card(_round.main_deck.cards.pop())
+    room.broadcast_state_to_others("ALICE", _round)
+
+    assert len(received["BOB"]) == 2
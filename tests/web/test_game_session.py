@@ -0,0 +1,135 @@
+"""
+Tests for the log batcher and the game runner pool in src/web/game_session.py.
+"""
+import threading
+import time
+
+import pytest
+
+from src.web.event_bus import EventBus
+from src.web.game_session import _GameRunnerPool, _LogBatcher
+
+
+def _recording_bus():
+    bus = EventBus()
+    events = []
+    bus.subscribe("log", lambda m: events.append(("log", m)))
+    bus.subscribe("log_batch", lambda ms: events.append(("log_batch", ms)))
+    return bus, events
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+# --- _LogBatcher ---
+
+def test_batcher_flushes_when_batch_is_full():
+    bus, events = _recording_bus()
+    batcher = _LogBatcher(bus)  # not started: only size triggers a flush
+
+    for i in range(31):
+        batcher.add(f"line {i}")
+    assert events == []
+
+    batcher.add("line 31")
+    assert events == [("log_batch", [f"line {i}" for i in range(32)])]
+
+
+def test_batcher_flushes_after_max_wait():
+    bus, events = _recording_bus()
+    batcher = _LogBatcher(bus, max_wait_ms=50)
+    batcher.start()
+    try:
+        batcher.add("a")
+        batcher.add("b")
+        assert _wait_until(lambda: events)
+        assert events == [("log_batch", ["a", "b"])]
+    finally:
+        batcher.stop()
+
+
+def test_batcher_stop_sends_pending_lines():
+    bus, events = _recording_bus()
+    batcher = _LogBatcher(bus, max_wait_ms=60_000)
+    batcher.start()
+
+    batcher.add("a")
+    batcher.add("b")
+    batcher.stop()
+
+    assert events == [("log_batch", ["a", "b"])]
+
+
+def test_batcher_sends_single_line_as_log():
+    bus, events = _recording_bus()
+    batcher = _LogBatcher(bus)
+
+    batcher.add("only")
+    batcher.flush()
+
+    assert events == [("log", "only")]
+
+
+# --- _GameRunnerPool ---
+
+def _run(pool: _GameRunnerPool, fn=None) -> threading.Thread:
+    """Submit a task and return the thread that ran it."""
+    done = threading.Event()
+    ran_on = []
+
+    def task():
+        ran_on.append(threading.current_thread())
+        done.set()
+        if fn is not None:
+            fn()
+
+    pool.submit(task)
+    assert done.wait(2)
+    return ran_on[0]
+
+
+def test_pool_reuses_idle_worker():
+    pool = _GameRunnerPool(idle_timeout=5)
+
+    first = _run(pool)
+    assert _wait_until(lambda: pool._idle == 1)
+    second = _run(pool)
+
+    assert first is second
+
+
+def test_pool_worker_survives_task_exception():
+    pool = _GameRunnerPool(idle_timeout=5)
+
+    def fail():
+        raise RuntimeError("game crashed")
+
+    first = _run(pool, fail)
+    assert _wait_until(lambda: pool._idle == 1)
+    second = _run(pool)
+
+    assert first is second
+
+
+# The worker deliberately dies with an exception pytest would report
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_pool_replaces_dead_worker():
+    pool = _GameRunnerPool(idle_timeout=5)
+
+    def die():
+        raise SystemExit
+
+    first = _run(pool, die)
+    first.join(2)
+    assert not first.is_alive()
+    # The dead worker must not be counted as idle
+    assert pool._idle == 0
+    second = _run(pool)
+
+    assert first is not second
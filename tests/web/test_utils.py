@@ -0,0 +1,79 @@
+"""
+Tests for the debounce() helper in src/web/components/utils.py.
+
+nicegui is replaced by a stub whose ui.timer records the callbacks, so the
+window can be closed by hand.
+"""
+import importlib
+import sys
+import types
+
+import pytest
+
+
+class _FakeTimer:
+    def __init__(self, interval, callback, once=False):
+        self.interval = interval
+        self.callback = callback
+        self.once = once
+
+
+@pytest.fixture
+def debounce(monkeypatch):
+    timers = []
+
+    def timer(interval, callback, once=False):
+        timers.append(_FakeTimer(interval, callback, once))
+        return timers[-1]
+
+    nicegui = types.ModuleType("nicegui")
+    nicegui.ui = types.SimpleNamespace(timer=timer)
+    monkeypatch.setitem(sys.modules, "nicegui", nicegui)
+    monkeypatch.delitem(sys.modules, "src.web.components.utils", raising=False)
+    utils = importlib.import_module("src.web.components.utils")
+    yield utils.debounce, timers
+    # Don't leave the stub-backed module behind for other tests
+    sys.modules.pop("src.web.components.utils", None)
+
+
+def test_first_call_runs_immediately_and_opens_one_window(debounce):
+    debounce_fn, timers = debounce
+    calls = []
+    wrapped = debounce_fn(calls.append, ms=150)
+
+    wrapped(1)
+
+    assert calls == [1]
+    assert len(timers) == 1
+    assert timers[0].interval == pytest.approx(0.15)
+    assert timers[0].once
+
+
+def test_calls_inside_window_collapse_into_one_trailing_call(debounce):
+    debounce_fn, timers = debounce
+    calls = []
+    wrapped = debounce_fn(calls.append)
+
+    wrapped(1)
+    wrapped(2)
+    wrapped(3)
+    assert calls == [1]
+    assert len(timers) == 1
+
+    timers[0].callback()
+    assert calls == [1, 3]
+
+
+def test_window_without_pending_call_fires_nothing(debounce):
+    debounce_fn, timers = debounce
+    calls = []
+    wrapped = debounce_fn(calls.append)
+
+    wrapped(1)
+    timers[0].callback()
+    assert calls == [1]
+
+    # The window is closed again, so the next call is a leading call
+    wrapped(2)
+    assert calls == [1, 2]
+    assert len(timers) == 2